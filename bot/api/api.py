@@ -1,12 +1,18 @@
+import functools
+import hmac
 import logging
 import os
 import sys
+import time
+from contextlib import asynccontextmanager
 from datetime import UTC, date, datetime, timedelta
 from typing import Literal
 
+import orjson
 from bson import Int64, ObjectId
-from fastapi import Depends, FastAPI, Header, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from bot.services.config_service import get_config_service
@@ -18,7 +24,18 @@ logger.addHandler(_handler)
 logger.setLevel(logging.INFO)
 logger.propagate = False
 
-app = FastAPI(title="Bot Config API", description="API for managing dynamic bot configuration", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize config and warm the Mongo pool before serving requests."""
+    environment = os.getenv("ENVIRONMENT", "dev")
+    await config_service.initialize(environment)
+    await config_service.ping()
+    logger.info(f"Config API started (env={environment})")
+    yield
+
+
+app = FastAPI(title="Bot Config API", description="API for managing dynamic bot configuration", version="1.0.0", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -34,6 +51,46 @@ app.add_middleware(
 
 config_service = get_config_service()
 
+# Response cache for the hot read endpoints, keyed per guild on
+# (configVersion, insert time). Entries are only valid while the version
+# matches and the TTL has not elapsed, so mutations and external writers
+# both converge quickly. Kept in-process since the stack runs no Redis.
+CONFIG_CACHE_TTL = 5.0
+_config_cache: dict[str, tuple[int, float, dict, bytes]] = {}
+
+MASKED_PROVIDERS = ["openai", "antropic", "google", "elevenlabs", "realTimeConfig", "openrouter", "mesh_router"]
+
+
+def _invalidate_config_cache(guild_id: str) -> None:
+    """Drop the cached masked config for a guild after a mutation."""
+    _config_cache.pop(guild_id, None)
+
+
+@functools.lru_cache(maxsize=1024)
+def _mask(length: int, last4: str) -> str:
+    """Masked form of a key; memoized since it only depends on (len, last 4)."""
+    return ("*" * (length - 4)) + last4 if length > 4 else "***"
+
+
+def _mask_api_keys(data: dict) -> dict:
+    """Mask provider API keys in a dumped config dict (in place)."""
+    if "aiConfig" in data:
+        for provider in MASKED_PROVIDERS:
+            if provider in data["aiConfig"] and data["aiConfig"][provider]:
+                p_data = data["aiConfig"][provider]
+                if isinstance(p_data, dict):
+                    key = p_data.get("apiKey", "")
+                    if key:
+                        # Convert to string if it's a SecretStr
+                        actual_key = key.get_secret_value() if hasattr(key, "get_secret_value") else str(key)
+                        p_data["apiKey"] = _mask(len(actual_key), actual_key[-4:])
+    return data
+
+
+def _build_config_body(version: int, data: dict) -> bytes:
+    """Serialize a /config response body once so cache hits are a pure memcpy."""
+    return orjson.dumps({"success": True, "version": version, "config": data, "message": None, "changed": None}, default=str)
+
 
 class DeleteUserMessagesConfig(BaseModel):
     enabled: bool
@@ -96,60 +153,60 @@ async def get_guild_id(x_guild_id: str = Header(default="default")):
 # Auth dependency
 async def verify_admin(x_admin_key: str = Header(...)):
     """Verify admin API key."""
-    # Ensure service is initialized
+    # Initialization happens once at startup; don't race N cold-start requests into it
     if config_service.base is None:
-        environment = os.getenv("ENVIRONMENT", "dev")
-        await config_service.initialize(environment)
+        raise HTTPException(status_code=503, detail="API not initialized")
 
-    expected_key = config_service.api_admin_key
+    expected_key = config_service.api_admin_key_bytes
 
     if not expected_key:
         raise HTTPException(status_code=500, detail="API not configured")
 
-    if x_admin_key != expected_key:
+    if not hmac.compare_digest(x_admin_key.encode(), expected_key):
         raise HTTPException(status_code=401, detail="Unauthorized")
 
     return True
 
 
-@app.on_event("startup")
-async def startup():
-    """Initialize config service on startup."""
-    environment = os.getenv("ENVIRONMENT", "dev")
-    await config_service.initialize(environment)
-    logger.info(f"Config API started (env={environment})")
-
-
 @app.get("/health")
 async def health():
     """Health check."""
     return {"status": "ok", "service": "config-api"}
 
 
-@app.get("/config", response_model=ConfigResponse)
-async def get_config(guild_id: str = Depends(get_guild_id), authorized: bool = Depends(verify_admin)):
+# response_model is deliberately None on the read endpoints: the handlers
+# return pre-serialized bytes, and re-validating them against ConfigResponse
+# would be pure overhead on the hottest path
+@app.get("/config", response_model=None)
+async def get_config(request: Request, guild_id: str = Depends(get_guild_id), authorized: bool = Depends(verify_admin)):
     """Get current dynamic config."""
     try:
         config_obj = await config_service.get_config(guild_id)
 
-        # Return config without sensitive data
-        data = config_obj.model_dump()
+        # A polling dashboard only pays header cost while the version holds
+        etag = f'"v{config_obj.configVersion}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
 
-        # Mask API keys
-        if "aiConfig" in data:
-            for provider in ["openai", "antropic", "google", "elevenlabs", "realTimeConfig", "openrouter", "mesh_router"]:
-                if provider in data["aiConfig"] and data["aiConfig"][provider]:
-                    p_data = data["aiConfig"][provider]
-                    if isinstance(p_data, dict):
-                        key = p_data.get("apiKey", "")
-                        if key:
-                            # Convert to string if it's a SecretStr
-                            actual_key = key.get_secret_value() if hasattr(key, "get_secret_value") else str(key)
-                            data["aiConfig"][provider]["apiKey"] = ("*" * (len(actual_key) - 4)) + actual_key[-4:] if len(actual_key) > 4 else "***"
+        cached = _config_cache.get(guild_id)
+        if cached is not None and cached[0] == config_obj.configVersion and time.monotonic() - cached[1] < CONFIG_CACHE_TTL:
+            return Response(content=cached[3], media_type="application/json", headers={"ETag": etag})
 
-        return ConfigResponse(success=True, version=config_obj.configVersion, config=data)
+        # Mask API keys and serialize once; cache hits return the same bytes
+        data = _mask_api_keys(config_obj.model_dump())
+        body = _build_config_body(config_obj.configVersion, data)
+
+        _config_cache[guild_id] = (config_obj.configVersion, time.monotonic(), data, body)
+
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
     except Exception as e:
+        # Stale-while-error: if Mongo is unreachable, serve the last good body
+        # instead of failing the read.
+        cached = _config_cache.get(guild_id)
+        if cached is not None:
+            logger.warning(f"Serving stale config for guild {guild_id} after error: {e}")
+            return Response(content=cached[3], media_type="application/json", headers={"X-Cache": "STALE"})
         logger.error(f"Error getting config: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -160,16 +217,14 @@ async def update_config(updates: UpdateConfigRequest, guild_id: str = Depends(ge
     try:
         logger.info(f"Updating config for guild {guild_id} with updates: {updates}")
 
-        # Convert to dict and filter None values
-        update_dict = {k: v for k, v in updates.model_dump().items() if v is not None}
+        # Only serialize fields the client actually sent
+        update_dict = updates.model_dump(exclude_unset=True, exclude_none=True)
 
         if not update_dict:
             raise HTTPException(status_code=400, detail="No updates provided")
 
-        await config_service.update(guild_id, update_dict)
-
-        # Fetch updated config to get version
-        new_config = await config_service.get_config(guild_id)
+        new_config = await config_service.update(guild_id, update_dict)
+        _invalidate_config_cache(guild_id)
 
         return ConfigResponse(success=True, message="Config updated", version=new_config.configVersion)
 
@@ -178,11 +233,12 @@ async def update_config(updates: UpdateConfigRequest, guild_id: str = Depends(ge
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@app.post("/config/reload", response_model=ConfigResponse)
-async def reload_config(guild_id: str = Depends(get_guild_id), authorized: bool = Depends(verify_admin)):
+@app.post("/config/reload", response_model=None)
+async def reload_config(guild_id: str = Depends(get_guild_id), authorized: bool = Depends(verify_admin)) -> ConfigResponse:
     """Force reload config from MongoDB."""
     try:
         await config_service.reload_if_changed()
+        _invalidate_config_cache(guild_id)
         # Even if reload_if_changed checks all, we return context for current guild
         config_obj = await config_service.get_config(guild_id)
 
@@ -197,72 +253,66 @@ async def reload_config(guild_id: str = Depends(get_guild_id), authorized: bool
 async def update_ai_provider(data: UpdateAIProviderRequest, guild_id: str = Depends(get_guild_id), authorized: bool = Depends(verify_admin)):
     """Update AI provider settings."""
     try:
-        config_obj = await config_service.get_config(guild_id)
-
-        # Prepare updates
-        ai_config_dict = config_obj.aiConfig.model_dump()
-        ai_config_dict["preferredAiProvider"] = data.provider
-
-        # Update provider-specific settings in the dict
-        # We need to ensure the provider dict exists
-        if data.provider not in ai_config_dict or ai_config_dict[data.provider] is None:
-            # Should be initialized by default_factory, but safe check
-            pass  # Pydantic defaults handles this usually
-
-        if data.apiKey is not None:
-            # If the API key is masked (consists of or contains asterisks), do not overwrite the existing one
-            if "*" in data.apiKey:
-                pass
-            else:
-                ai_config_dict[data.provider]["apiKey"] = data.apiKey
+        # Build only the fields that changed; update_nested deep-merges them
+        # into the stored aiConfig instead of rewriting the whole subtree
+        ai_updates: dict = {"preferredAiProvider": data.provider}
+
+        provider_updates: dict = {}
+        if data.apiKey is not None and "*" not in data.apiKey:
+            # A masked key (contains asterisks) means "keep the existing one"
+            provider_updates["apiKey"] = data.apiKey
         if data.preferredModel is not None:
-            ai_config_dict[data.provider]["preferredModel"] = data.preferredModel
+            provider_updates["preferredModel"] = data.preferredModel
         if data.endpoint is not None:
-            ai_config_dict[data.provider]["endpoint"] = data.endpoint
+            provider_updates["endpoint"] = data.endpoint
         if data.voice is not None:
-            ai_config_dict[data.provider]["voice"] = data.voice
+            provider_updates["voice"] = data.voice
+        if provider_updates:
+            ai_updates[data.provider] = provider_updates
 
-        # Handle Orchestrator-specific updates
+        # Orchestrator-specific updates
+        orchestrator_updates: dict = {}
         if data.orchestratorProvider is not None:
-            ai_config_dict["orchestrator"]["preferredAiProvider"] = data.orchestratorProvider
+            orchestrator_updates["preferredAiProvider"] = data.orchestratorProvider
         if data.orchestratorModel is not None:
-            ai_config_dict["orchestrator"]["preferredModel"] = data.orchestratorModel
+            orchestrator_updates["preferredModel"] = data.orchestratorModel
+        if orchestrator_updates:
+            ai_updates["orchestrator"] = orchestrator_updates
 
-        # Handle Prompt-specific updates
+        # Prompt-specific updates
         if data.systemPrompt is not None:
-            ai_config_dict["systemPrompt"] = data.systemPrompt
+            ai_updates["systemPrompt"] = data.systemPrompt
         if data.realtimePrompt is not None:
-            ai_config_dict["realtimePrompt"] = data.realtimePrompt
-
-        # Handle Image Generation updates
-        if "imageGeneration" not in ai_config_dict or ai_config_dict["imageGeneration"] is None:
-            ai_config_dict["imageGeneration"] = {}
+            ai_updates["realtimePrompt"] = data.realtimePrompt
 
+        # Image Generation updates
+        image_gen_updates: dict = {}
         if data.boostImagePrompts is not None:
-            ai_config_dict["boostImagePrompts"] = data.boostImagePrompts
-            ai_config_dict["imageGeneration"]["boostImagePrompts"] = data.boostImagePrompts
+            ai_updates["boostImagePrompts"] = data.boostImagePrompts
+            image_gen_updates["boostImagePrompts"] = data.boostImagePrompts
         if data.maxDailyImages is not None:
-            ai_config_dict["imageGeneration"]["maxDailyImages"] = data.maxDailyImages
+            image_gen_updates["maxDailyImages"] = data.maxDailyImages
         if data.imageGenProvider is not None:
-            ai_config_dict["imageGeneration"]["preferredAiProvider"] = data.imageGenProvider
-            ai_config_dict["imageGeneration"]["preferredAiProvidder"] = data.imageGenProvider
+            image_gen_updates["preferredAiProvider"] = data.imageGenProvider
+            image_gen_updates["preferredAiProvidder"] = data.imageGenProvider
         if data.imageGenModel is not None:
-            ai_config_dict["imageGeneration"]["preferredModel"] = data.imageGenModel
-
-        # Handle AI Usage Limits updates
-        if "usageLimits" not in ai_config_dict or ai_config_dict["usageLimits"] is None:
-            ai_config_dict["usageLimits"] = {}
+            image_gen_updates["preferredModel"] = data.imageGenModel
+        if image_gen_updates:
+            ai_updates["imageGeneration"] = image_gen_updates
 
+        # AI Usage Limits updates
+        usage_limit_updates: dict = {}
         if data.aiUsageLimitEnabled is not None:
-            ai_config_dict["usageLimits"]["enabled"] = data.aiUsageLimitEnabled
+            usage_limit_updates["enabled"] = data.aiUsageLimitEnabled
         if data.maxRequestsPerMinute is not None:
-            ai_config_dict["usageLimits"]["maxRequestsPerMinute"] = data.maxRequestsPerMinute
+            usage_limit_updates["maxRequestsPerMinute"] = data.maxRequestsPerMinute
         if data.maxRequestsPerHour is not None:
-            ai_config_dict["usageLimits"]["maxRequestsPerHour"] = data.maxRequestsPerHour
+            usage_limit_updates["maxRequestsPerHour"] = data.maxRequestsPerHour
+        if usage_limit_updates:
+            ai_updates["usageLimits"] = usage_limit_updates
 
-        await config_service.update(guild_id, {"aiConfig": ai_config_dict})
-
-        new_config = await config_service.get_config(guild_id)
+        new_config = await config_service.update_nested(guild_id, {"aiConfig": ai_updates})
+        _invalidate_config_cache(guild_id)
 
         return ConfigResponse(success=True, message=f"AI provider updated to {data.provider}", version=new_config.configVersion)
 
@@ -275,17 +325,12 @@ async def update_ai_provider(data: UpdateAIProviderRequest, guild_id: str = Depe
 async def add_admin(data: AddAdminRequest, guild_id: str = Depends(get_guild_id), authorized: bool = Depends(verify_admin)):
     """Add admin user ID."""
     try:
-        config_obj = await config_service.get_config(guild_id)
+        new_config = await config_service.add_admin_id(guild_id, data.userId)
 
-        if data.userId in config_obj.adminIds:
+        if new_config is None:
             raise HTTPException(status_code=400, detail="User already admin")
 
-        admins = config_obj.adminIds.copy()
-        admins.append(data.userId)
-
-        await config_service.update(guild_id, {"adminIds": admins})
-
-        new_config = await config_service.get_config(guild_id)
+        _invalidate_config_cache(guild_id)
 
         return ConfigResponse(success=True, message=f"Added admin {data.userId}", version=new_config.configVersion)
 
@@ -300,19 +345,16 @@ async def add_admin(data: AddAdminRequest, guild_id: str = Depends(get_guild_id)
 async def remove_admin(user_id: str, guild_id: str = Depends(get_guild_id), authorized: bool = Depends(verify_admin)):
     """Remove admin user ID."""
     try:
-        config_obj = await config_service.get_config(guild_id)
+        new_config = await config_service.remove_admin_id(guild_id, user_id)
 
-        if user_id not in config_obj.adminIds:
-            raise HTTPException(status_code=404, detail="User not admin")
-
-        admins = [uid for uid in config_obj.adminIds if uid != user_id]
-
-        if not admins:
+        if new_config is None:
+            # Nothing matched: either the user isn't an admin, or they're the last one
+            config_obj = await config_service.get_config(guild_id)
+            if user_id not in config_obj.adminIds:
+                raise HTTPException(status_code=404, detail="User not admin")
             raise HTTPException(status_code=400, detail="Cannot remove last admin")
 
-        await config_service.update(guild_id, {"adminIds": admins})
-
-        new_config = await config_service.get_config(guild_id)
+        _invalidate_config_cache(guild_id)
 
         return ConfigResponse(success=True, message=f"Removed admin {user_id}", version=new_config.configVersion)
 
@@ -324,11 +366,16 @@ async def remove_admin(user_id: str, guild_id: str = Depends(get_guild_id), auth
 
 
 @app.get("/config/version")
-async def get_version(guild_id: str = Depends(get_guild_id), authorized: bool = Depends(verify_admin)):
+async def get_version(request: Request, guild_id: str = Depends(get_guild_id), authorized: bool = Depends(verify_admin)):
     """Get current config version."""
     try:
         config_obj = await config_service.get_config(guild_id)
-        return {"version": config_obj.configVersion, "lastUpdated": config_obj.lastUpdated}
+
+        etag = f'"v{config_obj.configVersion}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        return ORJSONResponse({"version": config_obj.configVersion, "lastUpdated": config_obj.lastUpdated}, headers={"ETag": etag})
     except Exception as e:
         logger.error(f"Error getting version: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
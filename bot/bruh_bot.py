@@ -1,6 +1,11 @@
+import asyncio
+import io
 import logging
 import os
+import py_compile
 import time
+from operator import attrgetter
+from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -38,6 +43,8 @@ from bot.services.ai import (
 from bot.services.music.music_websocket_service import MusicWebSocketService
 from bot.utils import SlashLoader
 
+COGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cogs")
+
 
 class BruhBot(commands.Bot):
     def __init__(self, intents, config_service: ConfigService):
@@ -48,10 +55,10 @@ class BruhBot(commands.Bot):
             activity=None,
         )
         self.start_time = time.time()
+        self._ready_ran = False
         self.slash_loader = SlashLoader(self.tree)
         self.config_service = config_service
         self.logger = logging.getLogger(__name__)
-        self._config_reload_lock = False
 
         # Services
         self.embed_service = EmbedService()
@@ -145,26 +152,43 @@ class BruhBot(commands.Bot):
         await self.load_cogs()
         await self.music_websocket_service.start_server(port=int(os.getenv("WS_PORT", 8001)))
 
+    async def close(self):
+        try:
+            await self.image_generation_service.close()
+        except Exception as e:
+            self.logger.warning(f"Failed to close image generation HTTP session: {e}")
+        await super().close()
+
     async def load_cogs(self):
-        cogs_dir = os.path.join(os.getcwd(), "bot", "cogs")
-        self.logger.info(f"📁 Looking for cogs in: {cogs_dir}")
+        self.logger.info(f"📁 Looking for cogs in: {COGS_DIR}")
+
+        # Scan and pre-warm in a worker thread so a slow disk doesn't stall the
+        # event loop during setup_hook. Compiling up front means the
+        # load_extension imports below hit fresh .pyc files instead of parsing
+        # source on the loop thread.
+        def _scan() -> list[str]:
+            paths = [p for p in Path(COGS_DIR).glob("*.py") if p.name != "__init__.py"]
+            for p in paths:
+                py_compile.compile(str(p), doraise=False, quiet=1)
+            return [p.stem for p in paths]
 
-        cog_files = [f[:-3] for f in os.listdir(cogs_dir) if f.endswith(".py") and f != "__init__.py"]
+        cog_files = await asyncio.to_thread(_scan)
 
         total = len(cog_files)
         loaded_successfully = 0
 
         self.logger.info(f"📁 Found {total} cogs to load")
 
-        for cog_name in cog_files:
-            extension_path = f"bot.cogs.{cog_name}"
+        # Cog imports are independent; gather overlaps their disk I/O and
+        # setup() awaits instead of serializing them
+        results = await asyncio.gather(*(self.load_extension(f"bot.cogs.{cog_name}") for cog_name in cog_files), return_exceptions=True)
 
-            try:
-                await self.load_extension(extension_path)
+        for cog_name, result in zip(cog_files, results, strict=True):
+            if isinstance(result, Exception):
+                self.logger.error(f"❌ Failed to load cog {cog_name}: {str(result)}")
+            else:
                 loaded_successfully += 1
                 self.logger.info(f"✅ Successfully loaded cog: {cog_name}")
-            except Exception as e:
-                self.logger.error(f"❌ Failed to load cog {cog_name}: {str(e)}")
 
         if loaded_successfully == total:
             self.logger.info(f"🎉 All {loaded_successfully} cogs loaded successfully!")
@@ -172,13 +196,22 @@ class BruhBot(commands.Bot):
             self.logger.info(f"📊 Cogs loaded: {loaded_successfully}/{total}")
 
     async def on_ready(self):
+        # READY fires again after gateway reconnects; the guild-info sync,
+        # member sync, and reputation report below are full passes over every
+        # guild and only need to run once per process
+        if self._ready_ran:
+            self.logger.info("Reconnected to the gateway")
+            return
+        self._ready_ran = True
+
         startup_time = time.time() - self.start_time
 
         self.logger.info(f"Logged in as {self.user} (ID: {self.user.id})")
         self.logger.info(f"Startup completed in {startup_time:.2f} seconds")
 
         guild_count = len(self.guilds)
-        user_count = sum(g.member_count for g in self.guilds)
+        # member_count is None for unavailable guilds; filter before summing
+        user_count = sum(filter(None, map(attrgetter("member_count"), self.guilds)))
 
         self.logger.info(f"🌐 Connected to {guild_count} guilds with access to {user_count} users")
 
@@ -229,15 +262,21 @@ class BruhBot(commands.Bot):
         if message.author == self.user:
             return
 
-        author_id = str(message.author.id)
-        guild_id = str(message.guild.id) if message.guild else "dm"
+        # Bind the snowflake ints once; everything below reuses these instead
+        # of re-reading the attributes and re-stringifying per call site
+        author_id_int = message.author.id
+        guild_id_int = message.guild.id if message.guild else None
+        author_id = str(author_id_int)
+        guild_id = str(guild_id_int) if guild_id_int else "dm"
 
-        config = await self.config_service.get_config(guild_id=guild_id)
+        # Sync cache hit for loaded guilds; only the first message of a guild
+        # after startup pays the coroutine + Mongo load
+        config = self.config_service.get_cached_config(guild_id) or await self.config_service.get_config(guild_id=guild_id)
 
-        if message.author.bot and author_id not in config.allowedBotsToRespondTo:
+        if message.author.bot and author_id not in config.allowedBotsSet:
             return
 
-        if author_id in config.globalBlockList:
+        if author_id in config.globalBlockSet:
             return
 
         if message.guild:
@@ -248,14 +287,14 @@ class BruhBot(commands.Bot):
                 has_attachment = bool(message.attachments)
                 is_bot_mention = self.user in message.mentions
                 old_level, new_level, leveled_up = await self.economy_service.handle_message_event(
-                    guild_id=message.guild.id,
-                    user_id=message.author.id,
+                    guild_id=guild_id_int,
+                    user_id=author_id_int,
                     config=econ_config,
                     has_attachment=has_attachment,
                     is_bot_mention=is_bot_mention,
                 )
                 if leveled_up and econ_config.levelUpAnnounceInChannel:
-                    profile = await self.economy_service.get_profile(message.guild.id, message.author.id)
+                    profile = await self.economy_service.get_profile(guild_id_int, author_id_int)
                     next_xp = profile["xp_for_next_level"]
                     embed = self.embed_service.create_success_embed(
                         f"{message.author.mention} reached **Level {new_level}**! 🎉\nTotal XP: **{profile['xp']:,}** · Next level: **{next_xp:,} XP**",
@@ -263,18 +302,35 @@ class BruhBot(commands.Bot):
                     )
                     await message.channel.send(embed=embed)
 
-        if await self.message_service.should_delete_message(message.guild.id, message):
-            await self.response_service.send_response(message, "L + RATIO", reply=False)
-            await message.delete()
+        # Deletion rules come from the config already in hand - no need for
+        # the await + second config fetch in should_delete_message
+        delete_cfg = config.deleteUserMessages
+        if delete_cfg.enabled and author_id_int in delete_cfg.userIds:
+            # The callout and the deletion are independent API calls; overlap
+            # them, and don't let one failing suppress the other
+            results = await asyncio.gather(
+                self.response_service.send_response(message, "L + RATIO", reply=False),
+                message.delete(),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error handling blocked message: {result}")
+
+        # Cheap sync gate: a message that neither mentions the bot nor replies
+        # to anything can't need a response - skip the reference fetch and
+        # reputation checks entirely for the bulk of guild traffic
+        if self.user not in message.mentions and message.reference is None:
+            return
 
         # Check if bot is mentioned or message is a reply to the bot
         reference_message = await self.message_service.get_reference_message(message)
         if not await self.message_service.should_respond_to_message(message, reference_message):
             return
 
-        can_respond, reputation = await self.reputation_service.can_respond(message.guild.id, message.author.id)
+        can_respond, reputation = await self.reputation_service.can_respond(guild_id_int, author_id_int)
         if not can_respond:
-            reputation = await self.reputation_service.refresh_block(message.guild.id, message.author.id)
+            reputation = await self.reputation_service.refresh_block(guild_id_int, author_id_int)
             await self._send_reputation_notice(message, reputation, blocked=True, force=True)
             return
         if reputation.get("status") == "warning":
@@ -286,19 +342,34 @@ class BruhBot(commands.Bot):
             await self.reputation_extraction_service.enqueue_bot_context(reference_message, context)
         await self.reputation_extraction_service.enqueue_message(message)
 
-        # Apply cooldown check
-        if not await self.cooldown_service.check_cooldown(message.author.id, message.guild.id, message.author.display_name):
+        # Check the cooldown and claim the slot in one Mongo round trip
+        if not await self.cooldown_service.check_and_bump(author_id_int, guild_id_int, message.author.display_name):
             return
 
-        # Update cooldown and log interaction
-        await self.cooldown_service.update_cooldown(message.author.id, message.guild.id)
         user = message.author
         guild = message.guild
-        self.logger.info(f"📝 {user.name} mentioned bruh.bot in {message.channel.name if guild else 'DM'}: {message.content}")
+        # %-style so the string (including message content) is only built
+        # when an INFO handler is actually attached
+        self.logger.info("📝 %s mentioned bruh.bot in %s: %s", user.name, message.channel.name if guild else "DM", message.content)
+
+        # Process and respond. Typing is started lazily so fast replies skip
+        # the TYPING HTTP call entirely; slow (LLM-bound) replies still show
+        # the indicator after a short grace period.
+        typing_task = asyncio.create_task(self._delayed_typing(message.channel, 0.5))
+        try:
+            await self._handle_message_intent(message, reference_message, config)
+        finally:
+            typing_task.cancel()
+
+    async def _delayed_typing(self, channel: discord.abc.Messageable, delay: float):
+        """Start the typing indicator after ``delay`` seconds.
 
-        # Process and respond
-        async with message.channel.typing():
-            await self._handle_message_intent(message, reference_message)
+        Runs until cancelled; the context manager re-sends TYPING every few
+        seconds while the response is still being generated.
+        """
+        await asyncio.sleep(delay)
+        async with channel.typing():
+            await asyncio.sleep(3600)
 
     async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
         """Handle voice state updates for bot disconnection and empty channel cleanup."""
@@ -349,32 +420,50 @@ class BruhBot(commands.Bot):
                 except Exception:
                     self.logger.debug("Failed to upsert user on update", exc_info=True)
 
-    async def _handle_message_intent(self, message: discord.Message, reference_message):
-        """Handle the user's message based on detected intent."""
+    async def _handle_message_intent(self, message: discord.Message, reference_message, config=None):
+        """Handle the user's message based on detected intent.
+
+        ``config`` is the guild config on_message already fetched; threading
+        it through saves the downstream handlers a repeat lookup.
+        """
         is_replying_to_bot_image = await self.message_service.is_replying_to_bot_image(reference_message)
 
-        user_intent: UserIntent = await self.ai_orchestrator.detect_intent(
-            message.guild.id,
-            user_message=message.content,
-            is_replying_to_bot_image=is_replying_to_bot_image,
+        intent_task = asyncio.create_task(
+            self.ai_orchestrator.detect_intent(
+                message.guild.id,
+                user_message=message.content,
+                is_replying_to_bot_image=is_replying_to_bot_image,
+            )
         )
+        # Context building is read-only and doesn't depend on the detected
+        # intent, so overlap it with the intent LLM call; the image path
+        # builds its own context with different arguments
+        context_task = asyncio.create_task(self.message_service.build_message_context(message, reference_message, message.author.display_name))
+
+        user_intent: UserIntent = await intent_task
 
         if user_intent.intent == "chat":
-            await self._handle_chat_intent(message, reference_message, user_intent)
-        elif user_intent.intent == "image_generation":
-            await self._handle_image_generation_intent(message, reference_message)
+            await self._handle_chat_intent(message, reference_message, user_intent, context_task, config)
+        else:
+            context_task.cancel()
+            if user_intent.intent == "image_generation":
+                await self._handle_image_generation_intent(message, reference_message)
 
-    async def _handle_chat_intent(self, message: discord.Message, reference_message, user_intent: UserIntent):
+    async def _handle_chat_intent(self, message: discord.Message, reference_message, user_intent: UserIntent, context_task: asyncio.Task | None = None, config=None):
         """Handle chat intent."""
-        self.logger.info(f"Chatting with intent: {user_intent.intent} for reason of: {user_intent.reasoning}")
-        aiConfig = (await self.config_service.get_config(str(message.guild.id))).aiConfig
+        self.logger.info("Chatting with intent: %s for reason of: %s", user_intent.intent, user_intent.reasoning)
+        if config is None:
+            config = await self.config_service.get_config(str(message.guild.id))
+        aiConfig = config.aiConfig
 
         can_request, limit_msg = await self.ai_usage_service.consume_request(message.author.id, message.guild.id)
         if not can_request:
+            if context_task:
+                context_task.cancel()
             await self.response_service.send_response(message, limit_msg)
             return
 
-        messages = await self.message_service.build_message_context(message, reference_message, message.author.display_name)
+        messages = await context_task if context_task else await self.message_service.build_message_context(message, reference_message, message.author.display_name)
 
         from bot.services.ai.gateway.gateway import get_mesh_gateway
         from bot.services.ai.gateway.schemas.request import NormalizedRequest
@@ -418,20 +507,30 @@ class BruhBot(commands.Bot):
 
         req = NormalizedRequest(provider=provider, model=preferred_model, messages=messages)
         gateway = get_mesh_gateway()
-        response = await gateway.complete(req, credentials={"api_key": api_key})
 
-        if response.usage:
+        # Stream so the reply starts appearing at time-to-first-token instead
+        # of after the full completion lands
+        usage: dict | None = None
+
+        async def _text_deltas():
+            nonlocal usage
+            async for chunk in gateway.stream(req, credentials={"api_key": api_key}):
+                if chunk.type == "text_delta" and chunk.delta:
+                    yield chunk.delta
+                elif chunk.type == "usage" and chunk.usage:
+                    usage = chunk.usage
+
+        sent_msg, content = await self.response_service.stream_response(message, _text_deltas(), postprocess=self.message_service.strip_assistant_prefix)
+
+        if usage:
             await self.ai_usage_tracking_service.track_usage(
                 user_id=message.author.id,
                 guild_id=message.guild.id,
-                input_tokens=response.usage.get("input_tokens", 0),
-                output_tokens=response.usage.get("output_tokens", 0),
-                cost=response.usage.get("cost", 0),
-                model=response.model or preferred_model,
+                input_tokens=usage.get("input_tokens", 0),
+                output_tokens=usage.get("output_tokens", 0),
+                cost=usage.get("cost", 0),
+                model=usage.get("model") or preferred_model,
             )
-
-        content = self.message_service.strip_assistant_prefix("".join(part.content for part in response.parts if part.type == "text"))
-        sent_msg = await self.response_service.send_response(message, content)
         if sent_msg:
             await self.chat_service.save_message(
                 message_id=sent_msg.id,
@@ -450,7 +549,9 @@ class BruhBot(commands.Bot):
             await self.response_service.send_response(message, "Image generation is only available in servers.")
             return
 
-        can_generate, limit_message = await self.image_limit_service.can_generate_image(message)
+        # One atomic check-and-consume instead of a check now and an
+        # increment after generation; refunded below if generation fails
+        can_generate, limit_message = await self.image_limit_service.reserve_slot(message)
 
         self.logger.info(f"[HANDLEIMAGEGENERATIONINTENT] - {can_generate} - {limit_message}")
 
@@ -460,36 +561,45 @@ class BruhBot(commands.Bot):
 
         can_request, limit_msg = await self.ai_usage_service.consume_request(message.author.id, message.guild.id)
         if not can_request:
+            await self.image_limit_service.refund_slot(message.author.id, message.guild.id)
             await self.response_service.send_response(message, limit_msg)
             return
 
-        # Image requests share the same persisted branch history and memories as chat.
-        messages = await self.message_service.build_message_context(message, reference_message, message.author.display_name, include_current_images=False)
-        image_attachments = await self.message_service.get_image_attachments(message, reference_message)
-
-        if image_attachments:
-            self.logger.info(f"Editing/combining {len(image_attachments)} image(s)")
-            image_urls = [att.url for att in image_attachments]
-            image_generation_response: ImageGenerationResponse = await self.image_generation_service.edit_images_from_urls(
-                guild_id=message.guild.id,
-                prompt=message.content,
-                image_urls=image_urls,
-                messages=messages,
-                user_id=message.author.id,
-            )
-        else:
-            self.logger.info("No image attachments found, generating image with user prompt.")
-            image_generation_response: ImageGenerationResponse = await self.image_generation_service.generate_image(guild_id=message.guild.id, prompt=message.content, messages=messages, user_id=message.author.id)
+        try:
+            # Image requests share the same persisted branch history and memories as chat.
+            messages = await self.message_service.build_message_context(message, reference_message, message.author.display_name, include_current_images=False)
+            image_attachments = await self.message_service.get_image_attachments(message, reference_message)
+
+            if image_attachments:
+                self.logger.info(f"Editing/combining {len(image_attachments)} image(s)")
+                image_urls = [att.url for att in image_attachments]
+                image_generation_response: ImageGenerationResponse = await self.image_generation_service.edit_images_from_urls(
+                    guild_id=message.guild.id,
+                    prompt=message.content,
+                    image_urls=image_urls,
+                    messages=messages,
+                    user_id=message.author.id,
+                )
+            else:
+                self.logger.info("No image attachments found, generating image with user prompt.")
+                image_generation_response: ImageGenerationResponse = await self.image_generation_service.generate_image(guild_id=message.guild.id, prompt=message.content, messages=messages, user_id=message.author.id)
+        except Exception:
+            await self.image_limit_service.refund_slot(message.author.id, message.guild.id)
+            raise
 
         content = self.message_service.strip_assistant_prefix(image_generation_response.text_response)
 
-        if image_generation_response.generated_image:
-            await self.image_limit_service.increment_usage(message.author.id, message.guild.id)
-            image_bytes = self.image_generation_service.image_to_bytes(image=image_generation_response.generated_image)
+        if image_generation_response.raw_bytes or image_generation_response.generated_image:
+            if image_generation_response.raw_bytes:
+                # Provider returned PNG bytes; send them as-is
+                image_bytes = io.BytesIO(image_generation_response.raw_bytes)
+            else:
+                image_bytes = self.image_generation_service.image_to_bytes(image=image_generation_response.generated_image)
             filename = "edited_image.png" if image_attachments else "generated_image.png"
             image_file = discord.File(image_bytes, filename=filename)
             sent_msg = await self.response_service.send_response(message, content, image_file)
         else:
+            await self.image_limit_service.refund_slot(message.author.id, message.guild.id)
             sent_msg = await self.response_service.send_response(message, content)
 
         if sent_msg:
@@ -9,6 +9,11 @@ from bot.utils.decarators.admin_check import is_admin
 from bot.utils.decarators.command_logging import log_command_usage
 from bot.utils.decarators.global_block_check import is_globally_blocked
 
+_LOG = log_command_usage()
+_ADMIN = is_admin()
+_BLOCK = is_globally_blocked()
+
+
 if TYPE_CHECKING:
     from bot.bruh_bot import BruhBot
 
@@ -33,8 +38,8 @@ class EconomyCog(commands.Cog):
 
     @app_commands.command(name="rank", description="View your or another user's level and XP.")
     @app_commands.describe(user="User to check rank for (defaults to you)")
-    @log_command_usage()
-    @is_globally_blocked()
+    @_LOG
+    @_BLOCK
     async def rank(self, interaction: discord.Interaction, user: discord.Member | None = None):
         target = user or interaction.user
         profile = await self.bot.economy_service.get_profile(interaction.guild.id, target.id)
@@ -61,8 +66,8 @@ class EconomyCog(commands.Cog):
             app_commands.Choice(name="Coins", value="bruh_coins"),
         ]
     )
-    @log_command_usage()
-    @is_globally_blocked()
+    @_LOG
+    @_BLOCK
     async def leaderboard(self, interaction: discord.Interaction, sort_by: str = "xp"):
         entries = await self.bot.economy_service.get_leaderboard(interaction.guild.id, sort_by=sort_by)
         if not entries:
@@ -93,8 +98,8 @@ class EconomyCog(commands.Cog):
         await interaction.response.send_message(embed=embed, files=self.bot.embed_service.get_brand_files(embed=embed))
 
     @app_commands.command(name="balance", description="Check your bruh.coin balance.")
-    @log_command_usage()
-    @is_globally_blocked()
+    @_LOG
+    @_BLOCK
     async def balance(self, interaction: discord.Interaction):
         profile = await self.bot.economy_service.get_profile(interaction.guild.id, interaction.user.id)
         embed = self.bot.embed_service._create_base_embed(
@@ -105,8 +110,8 @@ class EconomyCog(commands.Cog):
         await interaction.response.send_message(embed=embed, files=self.bot.embed_service.get_brand_files(embed=embed))
 
     @app_commands.command(name="daily", description="Claim your daily bruh.coin reward.")
-    @log_command_usage()
-    @is_globally_blocked()
+    @_LOG
+    @_BLOCK
     async def daily(self, interaction: discord.Interaction):
         success, amount, cooldown_msg = await self.bot.economy_service.claim_daily(interaction.guild.id, interaction.user.id)
         if success:
@@ -120,8 +125,8 @@ class EconomyCog(commands.Cog):
 
     @app_commands.command(name="profile", description="View a full profile card for yourself or another user.")
     @app_commands.describe(user="User to view (defaults to you)")
-    @log_command_usage()
-    @is_globally_blocked()
+    @_LOG
+    @_BLOCK
     async def profile(self, interaction: discord.Interaction, user: discord.Member | None = None):
         target = user or interaction.user
         profile = await self.bot.economy_service.get_profile(interaction.guild.id, target.id)
@@ -151,8 +156,8 @@ class EconomyCog(commands.Cog):
     economy_group = app_commands.Group(name="economy", description="Admin economy management commands.")
 
     @economy_group.command(name="leaderboard", description="View the coin leaderboard (richest users).")
-    @log_command_usage()
-    @is_globally_blocked()
+    @_LOG
+    @_BLOCK
     async def economy_leaderboard(self, interaction: discord.Interaction):
         entries = await self.bot.economy_service.get_leaderboard(interaction.guild.id, sort_by="bruh_coins")
         if not entries:
@@ -183,9 +188,9 @@ class EconomyCog(commands.Cog):
 
     @economy_group.command(name="set-xp", description="Set a user's total XP.")
     @app_commands.describe(user="The user", amount="New XP amount")
-    @log_command_usage()
-    @is_admin()
-    @is_globally_blocked()
+    @_LOG
+    @_ADMIN
+    @_BLOCK
     async def economy_set_xp(self, interaction: discord.Interaction, user: discord.Member, amount: int):
         new_level = await self.bot.economy_service.set_xp(interaction.guild.id, user.id, amount)
         embed = self.bot.embed_service.create_success_embed(
@@ -196,9 +201,9 @@ class EconomyCog(commands.Cog):
 
     @economy_group.command(name="set-coins", description="Set a user's coin balance.")
     @app_commands.describe(user="The user", amount="New coin balance")
-    @log_command_usage()
-    @is_admin()
-    @is_globally_blocked()
+    @_LOG
+    @_ADMIN
+    @_BLOCK
     async def economy_set_coins(self, interaction: discord.Interaction, user: discord.Member, amount: float):
         await self.bot.economy_service.set_coins(interaction.guild.id, user.id, amount)
         embed = self.bot.embed_service.create_success_embed(
@@ -209,9 +214,9 @@ class EconomyCog(commands.Cog):
 
     @economy_group.command(name="set-level", description="Set a user's level.")
     @app_commands.describe(user="The user", level="New level")
-    @log_command_usage()
-    @is_admin()
-    @is_globally_blocked()
+    @_LOG
+    @_ADMIN
+    @_BLOCK
     async def economy_set_level(self, interaction: discord.Interaction, user: discord.Member, level: int):
         await self.bot.economy_service.set_level(interaction.guild.id, user.id, level)
         embed = self.bot.embed_service.create_success_embed(
@@ -222,9 +227,9 @@ class EconomyCog(commands.Cog):
 
     @economy_group.command(name="reset", description="Reset a user's economy profile entirely.")
     @app_commands.describe(user="The user to reset")
-    @log_command_usage()
-    @is_admin()
-    @is_globally_blocked()
+    @_LOG
+    @_ADMIN
+    @_BLOCK
     async def economy_reset(self, interaction: discord.Interaction, user: discord.Member):
         await self.bot.economy_service.reset_profile(interaction.guild.id, user.id)
         embed = self.bot.embed_service.create_success_embed(
@@ -235,9 +240,9 @@ class EconomyCog(commands.Cog):
 
     @economy_group.command(name="give-coins", description="Give coins to a user.")
     @app_commands.describe(user="The user", amount="Amount to give")
-    @log_command_usage()
-    @is_admin()
-    @is_globally_blocked()
+    @_LOG
+    @_ADMIN
+    @_BLOCK
     async def economy_give_coins(self, interaction: discord.Interaction, user: discord.Member, amount: float):
         new_balance = await self.bot.economy_service.add_coins(interaction.guild.id, user.id, amount)
         embed = self.bot.embed_service.create_success_embed(
@@ -248,9 +253,9 @@ class EconomyCog(commands.Cog):
 
     @economy_group.command(name="take-coins", description="Remove coins from a user.")
     @app_commands.describe(user="The user", amount="Amount to take")
-    @log_command_usage()
-    @is_admin()
-    @is_globally_blocked()
+    @_LOG
+    @_ADMIN
+    @_BLOCK
     async def economy_take_coins(self, interaction: discord.Interaction, user: discord.Member, amount: float):
         success, new_balance = await self.bot.economy_service.deduct_coins(interaction.guild.id, user.id, amount)
         if not success:
@@ -1,3 +1,4 @@
+import functools
 import logging
 from typing import TYPE_CHECKING
 
@@ -7,13 +8,33 @@ from discord.ext import commands
 
 from bot.services.embed_service import QueuePaginationView
 from bot.services.music.types import FilterPreset
-from bot.utils.decarators.command_logging import log_command_usage
-from bot.utils.decarators.global_block_check import is_globally_blocked
-from bot.utils.decarators.voice_check import require_voice_channel
+from bot.utils.decarators.music_command import music_command
 
 if TYPE_CHECKING:
     from bot.bruh_bot import BruhBot
 
+# Presets never change at runtime, so build the Choice objects (and their
+# lowercased names) once instead of per keystroke
+_FILTER_PRESETS = [(preset.display_name.lower(), preset.value.lower(), app_commands.Choice(name=preset.display_name, value=preset.value)) for preset in FilterPreset]
+
+
+@functools.lru_cache(maxsize=256)
+def _filter_choices(current_lower: str) -> tuple[app_commands.Choice[str], ...]:
+    """Memoized preset lookup for a typed prefix, prefix matches first."""
+    choices = []
+    substring_matches = []
+    for display_name, value, choice in _FILTER_PRESETS:
+        # startswith is the cheaper check and what users usually mean
+        if display_name.startswith(current_lower) or value.startswith(current_lower):
+            choices.append(choice)
+        elif current_lower in display_name or current_lower in value:
+            substring_matches.append(choice)
+
+    choices.extend(substring_matches)
+
+    # Discord limits autocomplete to 25 choices
+    return tuple(choices[:25])
+
 
 class MusicCog(commands.Cog):
     def __init__(self, bot: "BruhBot"):
@@ -26,35 +47,20 @@ class MusicCog(commands.Cog):
         current: str,
     ) -> list[app_commands.Choice[str]]:
         """Autocomplete for filter presets"""
-        choices = []
-        current_lower = current.lower()
-
-        for preset in FilterPreset:
-            # Filter based on user input
-            if current_lower in preset.display_name.lower() or current_lower in preset.value.lower():
-                choices.append(app_commands.Choice(name=preset.display_name, value=preset.value))
-
-                # Discord limits autocomplete to 25 choices
-                if len(choices) >= 25:
-                    break
-
-        return choices
+        return list(_filter_choices(current.lower()))
 
     @app_commands.command(name="join", description="Have the bot join the VC you are currently in.")
-    @log_command_usage()
-    @require_voice_channel(ephemeral=True, allow_admin_bypass=True)
-    @is_globally_blocked()
+    @music_command(ephemeral=True, allow_admin_bypass=True)
     async def join(self, interaction: discord.Interaction):
-        action_response = await self.bot.music_queue_service.get_player(interaction.guild).join(interaction)
+        player = self.bot.music_queue_service.get_player(interaction.guild)
+        action_response = await player.join(interaction)
         embed = self.bot.embed_service.create_action_embed(title="Joined Channel", message=action_response.message, is_success=action_response.is_success)
         await interaction.response.send_message(embed=embed, ephemeral=not action_response.is_success, files=self.bot.embed_service.get_brand_files(embed=embed))
 
     @app_commands.command(name="play", description="Play a song with a link or query.")
     @app_commands.describe(query="Song name or YouTube link", filter="Audio filter to apply")
     @app_commands.autocomplete(filter=filter_autocomplete)
-    @log_command_usage()
-    @require_voice_channel(ephemeral=True, allow_admin_bypass=True)
-    @is_globally_blocked()
+    @music_command(ephemeral=True, allow_admin_bypass=True)
     async def play(self, interaction: discord.Interaction, query: str, filter: str | None):
         await interaction.response.defer(ephemeral=True)
 
@@ -92,50 +98,44 @@ class MusicCog(commands.Cog):
             await interaction.followup.send(embed=embed, files=self.bot.embed_service.get_brand_files(embed=embed))
 
     @app_commands.command(name="skip", description="Skip actively playing audio.")
-    @log_command_usage()
-    @require_voice_channel(ephemeral=True, allow_admin_bypass=True)
-    @is_globally_blocked()
+    @music_command(ephemeral=True, allow_admin_bypass=True)
     async def skip(self, interaction: discord.Interaction):
-        skip_action_response = await self.bot.music_queue_service.get_player(interaction.guild).skip()
+        player = self.bot.music_queue_service.get_player(interaction.guild)
+        skip_action_response = await player.skip()
         embed = self.bot.embed_service.create_action_embed(title="Track Skip", message=skip_action_response.message, is_success=skip_action_response.is_success)
         await interaction.response.send_message(embed=embed, ephemeral=not skip_action_response.is_success, files=self.bot.embed_service.get_brand_files(embed=embed))
 
     @app_commands.command(name="pause", description="Pause the currently playing audio.")
-    @log_command_usage()
-    @require_voice_channel(ephemeral=True, allow_admin_bypass=True)
-    @is_globally_blocked()
+    @music_command(ephemeral=True, allow_admin_bypass=True)
     async def pause(self, interaction: discord.Interaction):
-        pause_action_response = await self.bot.music_queue_service.get_player(interaction.guild).pause()
+        player = self.bot.music_queue_service.get_player(interaction.guild)
+        pause_action_response = await player.pause()
         embed = self.bot.embed_service.create_action_embed(title="Playback Paused", message=pause_action_response.message, is_success=pause_action_response.is_success)
         await interaction.response.send_message(embed=embed, ephemeral=not pause_action_response.is_success, files=self.bot.embed_service.get_brand_files(embed=embed))
 
     @app_commands.command(name="resume", description="Resume audio that was previously paused.")
-    @log_command_usage()
-    @require_voice_channel(ephemeral=True, allow_admin_bypass=True)
-    @is_globally_blocked()
+    @music_command(ephemeral=True, allow_admin_bypass=True)
     async def resume(self, interaction: discord.Interaction):
-        resume_action_response = await self.bot.music_queue_service.get_player(interaction.guild).resume()
+        player = self.bot.music_queue_service.get_player(interaction.guild)
+        resume_action_response = await player.resume()
         embed = self.bot.embed_service.create_action_embed(title="Playback Resumed", message=resume_action_response.message, is_success=resume_action_response.is_success)
         await interaction.response.send_message(embed=embed, ephemeral=not resume_action_response.is_success, files=self.bot.embed_service.get_brand_files(embed=embed))
 
     @app_commands.command(name="leave", description="Have the bot leave the voice channel.")
-    @log_command_usage()
-    @require_voice_channel(ephemeral=True, allow_admin_bypass=True)
-    @is_globally_blocked()
+    @music_command(ephemeral=True, allow_admin_bypass=True)
     async def leave(self, interaction: discord.Interaction):
-        leave_action_response = await self.bot.music_queue_service.get_player(interaction.guild).leave()
+        player = self.bot.music_queue_service.get_player(interaction.guild)
+        leave_action_response = await player.leave()
         embed = self.bot.embed_service.create_action_embed(title="Disconnected", message=leave_action_response.message, is_success=leave_action_response.is_success)
         await interaction.response.send_message(embed=embed, ephemeral=not leave_action_response.is_success, files=self.bot.embed_service.get_brand_files(embed=embed))
 
     @app_commands.command(name="queue", description="View the current music queue.")
-    @log_command_usage()
-    @require_voice_channel(ephemeral=True, allow_admin_bypass=True)
-    @is_globally_blocked()
+    @music_command(ephemeral=True, allow_admin_bypass=True)
     async def queue(self, interaction: discord.Interaction):
         player = self.bot.music_queue_service.get_player(interaction.guild)
 
-        # Get a copy of the queue items
-        queue_items = list(player.queue._queue)
+        # Lazy view over the queue; pagination slices pages out on demand
+        queue_items = player.queue.view()
 
         embed = self.bot.embed_service.create_queue_embed(
             queue_items=queue_items,
@@ -150,9 +150,7 @@ class MusicCog(commands.Cog):
 
     @app_commands.command(name="filter", description="Apply a new audio filter to the current track.")
     @app_commands.autocomplete(new_filter=filter_autocomplete)
-    @log_command_usage()
-    @require_voice_channel(ephemeral=True, allow_admin_bypass=True)
-    @is_globally_blocked()
+    @music_command(ephemeral=True, allow_admin_bypass=True)
     async def filter(
         self,
         interaction: discord.Interaction,
@@ -178,9 +176,7 @@ class MusicCog(commands.Cog):
         minutes="Minutes (optional)",
         seconds="Seconds (optional)",
     )
-    @log_command_usage()
-    @require_voice_channel(ephemeral=True, allow_admin_bypass=True)
-    @is_globally_blocked()
+    @music_command(ephemeral=True, allow_admin_bypass=True)
     async def seek(
         self,
         interaction: discord.Interaction,
@@ -1,5 +1,8 @@
 import asyncio
+import concurrent.futures
 import logging
+import queue
+from collections import deque
 from typing import TYPE_CHECKING
 
 import discord
@@ -12,18 +15,102 @@ from bot.utils.decarators.command_logging import log_command_usage
 from bot.utils.decarators.global_block_check import is_globally_blocked
 from bot.utils.decarators.voice_check import require_voice_channel
 
+_LOG = log_command_usage()
+_ADMIN = is_admin()
+_BLOCK = is_globally_blocked()
+
+
 if TYPE_CHECKING:
     from bot.bruh_bot import BruhBot
 
+_BASE_INSTRUCTIONS = "You are bruh.bot, a Discord bot assistant. Keep responses brief and conversational. You're talking to people in a Discord voice channel."
+_LISTEN_ADDON = " You're currently listening to {name}."
+
+# Queue sentinel that tells the playback task to exit; distinct from None,
+# which marks end-of-response
+_SHUTDOWN = object()
+
+# One 20ms frame of silence (48kHz stereo int16), shared by every source
+# instead of allocating 3840 zero bytes 50 times a second while idle
+_SILENCE_FRAME = bytes(3840)
+
+
+class _RingBuffer:
+    """Fixed-capacity byte ring buffer for the 20ms audio read path.
+
+    bytearray slice-and-reassign (`buf = buf[n:]`) memcpys the whole tail on
+    every 50 Hz frame read; here extend() and pop() move bytes with memoryview
+    slice copies against a reusable backing store, so steady-state reads are
+    O(frame) and allocation-free. Grows (rarely) if a producer bursts past
+    capacity.
+    """
+
+    __slots__ = ("_buf", "_mv", "_capacity", "_head", "_size")
+
+    def __init__(self, capacity: int):
+        self._buf = bytearray(capacity)
+        self._mv = memoryview(self._buf)
+        self._capacity = capacity
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def extend(self, data: bytes):
+        n = len(data)
+        if n > self._capacity - self._size:
+            self._grow(max(self._capacity * 2, (self._size + n) * 2))
+        tail = (self._head + self._size) % self._capacity
+        first = min(n, self._capacity - tail)
+        self._mv[tail : tail + first] = data[:first]
+        if first < n:
+            self._mv[: n - first] = data[first:]
+        self._size += n
+
+    def pop(self, n: int) -> bytes:
+        """Remove and return up to n bytes from the front."""
+        n = min(n, self._size)
+        head = self._head
+        first = min(n, self._capacity - head)
+        if first == n:
+            out = bytes(self._mv[head : head + n])
+        else:
+            # Wrapped: stitch the two segments together
+            out = bytes(self._mv[head:]) + bytes(self._mv[: n - first])
+        self._head = (head + n) % self._capacity
+        self._size -= n
+        return out
+
+    def clear(self):
+        self._head = 0
+        self._size = 0
+
+    def _grow(self, new_capacity: int):
+        data = self.pop(self._size)
+        self._buf = bytearray(new_capacity)
+        self._mv = memoryview(self._buf)
+        self._capacity = new_capacity
+        self._head = 0
+        self._size = 0
+        if data:
+            self.extend(data)
+
 
 class QueuedAudioSource(discord.AudioSource):
-    """Custom audio source that reads from a queue for real-time streaming."""
+    """Custom audio source that reads from a queue for real-time streaming.
+
+    read() runs on discord.py's player thread, so the feed queue must be a
+    thread-safe queue.SimpleQueue - asyncio.Queue.get_nowait() is not safe to
+    call off-loop. Producers on the event loop can q.put() directly
+    (SimpleQueue never blocks on put).
+    """
 
-    def __init__(self, audio_queue: asyncio.Queue, audio_processor: AudioProcessor):
+    def __init__(self, audio_queue: queue.SimpleQueue, audio_processor: AudioProcessor):
         self.audio_queue = audio_queue
         self.audio_processor = audio_processor
-        self.buffer = bytearray()
         self.frame_size = 3840  # 20ms at 48kHz stereo (960 samples * 2 channels * 2 bytes)
+        self.buffer = _RingBuffer(self.frame_size * 10)
         self.logger = logging.getLogger(__name__)
         self.is_done = False
 
@@ -40,26 +127,23 @@ class QueuedAudioSource(discord.AudioSource):
                     break
 
                 # Upsample from 24kHz mono to 48kHz stereo
-                converted = self.audio_processor.upsample_audio(chunk, 24000, 48000)
+                converted = self.audio_processor.upsample_24k_to_48k(chunk)
                 if converted:
                     self.buffer.extend(converted)
 
-            except asyncio.QueueEmpty:
+            except queue.Empty:
                 break
 
         # Return a frame if we have enough data
         if len(self.buffer) >= self.frame_size:
-            frame = bytes(self.buffer[: self.frame_size])
-            self.buffer = self.buffer[self.frame_size :]
-            return frame
+            return self.buffer.pop(self.frame_size)
         elif self.is_done and len(self.buffer) > 0:
             # Return remaining data padded to frame size
-            frame = bytes(self.buffer) + b"\x00" * (self.frame_size - len(self.buffer))
-            self.buffer.clear()
-            return frame
+            frame = self.buffer.pop(len(self.buffer))
+            return frame + _SILENCE_FRAME[: self.frame_size - len(frame)]
         else:
             # Return silence if no data available
-            return b"\x00" * self.frame_size
+            return _SILENCE_FRAME
 
     def is_opus(self) -> bool:
         return False
@@ -87,7 +171,7 @@ class BufferedAudioSource(discord.AudioSource):
 
         # Pad with silence if needed
         if len(frame) < self.frame_size:
-            frame += b"\x00" * (self.frame_size - len(frame))
+            frame += _SILENCE_FRAME[: self.frame_size - len(frame)]
 
         return frame
 
@@ -103,34 +187,37 @@ class StreamingAudioSource(discord.AudioSource):
 
     def __init__(self, audio_processor: AudioProcessor):
         self.audio_processor = audio_processor
-        self.buffer = bytearray()
         self.frame_size = 3840  # 20ms at 48kHz stereo
+        self.buffer = _RingBuffer(self.frame_size * 10)
         self.logger = logging.getLogger(__name__)
-        self.pending_chunks = []
+        self.pending_chunks = deque()
         self.is_active = True
 
     def add_chunk(self, chunk: bytes):
         """Add a chunk of 24kHz mono audio to be played."""
         if chunk:
             # Convert immediately and add to pending
-            converted = self.audio_processor.upsample_audio(chunk, 24000, 48000)
+            converted = self.audio_processor.upsample_24k_to_48k(chunk)
             if converted:
                 self.pending_chunks.append(converted)
 
+    def add_converted_chunk(self, converted: bytes):
+        """Add audio that is already 48kHz stereo (converted off-loop)."""
+        if converted:
+            self.pending_chunks.append(converted)
+
     def read(self) -> bytes:
         """Read 20ms of audio (3840 bytes for 48kHz stereo)."""
         # Process any pending chunks
         while self.pending_chunks and len(self.buffer) < self.frame_size * 2:
-            self.buffer.extend(self.pending_chunks.pop(0))
+            self.buffer.extend(self.pending_chunks.popleft())
 
         # Return a frame if we have enough data
         if len(self.buffer) >= self.frame_size:
-            frame = bytes(self.buffer[: self.frame_size])
-            self.buffer = self.buffer[self.frame_size :]
-            return frame
+            return self.buffer.pop(self.frame_size)
         else:
             # Return silence if no data available yet
-            return b"\x00" * self.frame_size
+            return _SILENCE_FRAME
 
     def is_opus(self) -> bool:
         return False
@@ -155,12 +242,17 @@ class RealTimeVoiceCog(commands.Cog):
         #     'voice_client': VoiceRecvClient,
         #     'sink': VoiceReceiveSink,
         #     'audio_queue': asyncio.Queue,
+        #     'streaming_source': StreamingAudioSource,
         #     'playback_task': asyncio.Task,
         #     'listen_task': asyncio.Task
         # }
 
         self.audio_processor = AudioProcessor()
 
+        # Upsampling a multi-second response chunk is CPU-bound; keep it off
+        # the event loop so heartbeats and other cogs stay responsive
+        self._resample_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="resample")
+
     def _get_session(self, guild_id: int) -> dict | None:
         """Get the active session for a guild."""
         return self.active_sessions.get(guild_id)
@@ -170,74 +262,55 @@ class RealTimeVoiceCog(commands.Cog):
         return guild_id in self.active_sessions
 
     async def _audio_playback_task(self, guild_id: int):
-        """Monitor queue and start playing when audio arrives."""
+        """Feed incoming audio into the session's long-lived streaming source."""
         session = self._get_session(guild_id)
         if not session:
             return
 
         self.logger.info(f"Started audio playback task for guild {guild_id}")
 
+        loop = asyncio.get_running_loop()
+        backoff = 0.1
+
         try:
             while session["service"].is_running:
                 try:
-                    voice_client = session["voice_client"]
+                    # Block until audio arrives; no per-iteration timer churn -
+                    # voice_stop pushes the shutdown sentinel to wake us
+                    chunk = await session["audio_queue"].get()
 
-                    # Wait for audio to arrive in queue
-                    chunk = await asyncio.wait_for(session["audio_queue"].get(), timeout=0.5)
+                    if chunk is _SHUTDOWN:
+                        break
 
                     if chunk is None:
-                        # End marker, continue waiting for next response
+                        # End marker; the source just emits silence until the next response
                         continue
 
-                    # We have audio data - convert it first
-                    self.logger.info(f"Received audio chunk of {len(chunk)} bytes")
-
-                    # Upsample from 24kHz mono to 48kHz stereo
-                    converted = self.audio_processor.upsample_audio(chunk, 24000, 48000)
-
-                    if not converted:
-                        self.logger.warning("Failed to convert audio")
+                    source = session.get("streaming_source")
+                    if source is None or not source.is_active:
                         continue
 
-                    self.logger.info(f"Converted to {len(converted)} bytes for Discord")
-
-                    # Create audio source with the buffered data
-                    audio_source = BufferedAudioSource(converted)
+                    # Convert off-loop, then push into the already-playing
+                    # source - no stop()/play() cycle, no forced inter-chunk
+                    # silence, no new encoder state
+                    converted = await loop.run_in_executor(self._resample_pool, self.audio_processor.upsample_24k_to_48k, chunk)
+                    source.add_converted_chunk(converted)
+                    backoff = 0.1
 
-                    # Stop current playback if any
-                    if voice_client.is_playing():
-                        voice_client.stop()
-                        await asyncio.sleep(0.05)
-
-                    # Start playing
-                    if voice_client.is_connected():
-
-                        def after_playback(error):
-                            if error:
-                                self.logger.error(f"Playback error: {error}")
-                            else:
-                                self.logger.info("Playback completed successfully")
-
-                        voice_client.play(audio_source, after=after_playback)
-                        self.logger.info("Started playback")
-
-                        # Wait for playback to finish
-                        while voice_client.is_playing():
-                            await asyncio.sleep(0.1)
-
-                except TimeoutError:
-                    continue
                 except Exception as e:
                     self.logger.error(f"Error in playback task for guild {guild_id}: {e}", exc_info=True)
-                    await asyncio.sleep(0.1)
+                    # Back off exponentially so a persistently failing session
+                    # doesn't respin (and log) ten times a second
+                    await asyncio.sleep(backoff)
+                    backoff = min(backoff * 2, 5.0)
         finally:
             self.logger.info(f"Stopped audio playback task for guild {guild_id}")
 
     @app_commands.command(name="voice_join", description="Have the bot join your voice channel for conversation.")
-    @log_command_usage()
+    @_LOG
     @require_voice_channel(ephemeral=True, allow_admin_bypass=True)
-    @is_admin()
-    @is_globally_blocked()
+    @_ADMIN
+    @_BLOCK
     async def voice_join(self, interaction: discord.Interaction):
         """Join the user's voice channel."""
         if self._has_active_session(interaction.guild.id):
@@ -255,7 +328,7 @@ class RealTimeVoiceCog(commands.Cog):
             voice_client = await channel.connect(cls=voice_recv.VoiceRecvClient)
 
             # Initialize session storage
-            self.active_sessions[interaction.guild.id] = {"voice_client": voice_client, "service": None, "sink": None, "audio_queue": None, "playback_task": None, "listen_task": None}
+            self.active_sessions[interaction.guild.id] = {"voice_client": voice_client, "service": None, "sink": None, "audio_queue": None, "streaming_source": None, "playback_task": None, "listen_task": None}
 
             await interaction.followup.send(f"Joined {channel.name}! Use `/voice_start` to begin conversation.", ephemeral=True)
 
@@ -265,10 +338,10 @@ class RealTimeVoiceCog(commands.Cog):
 
     @app_commands.command(name="voice_start", description="Start a real-time conversation with the bot.")
     @app_commands.describe(listen_to="Optional: Specific user to listen to (leave empty to listen to everyone)")
-    @log_command_usage()
-    @is_admin()
+    @_LOG
+    @_ADMIN
     @require_voice_channel(ephemeral=True, allow_admin_bypass=True)
-    @is_globally_blocked()
+    @_BLOCK
     async def voice_start(self, interaction: discord.Interaction, listen_to: discord.Member | None = None):
         """Start a real-time conversation."""
         session = self._get_session(interaction.guild.id)
@@ -292,12 +365,7 @@ class RealTimeVoiceCog(commands.Cog):
             await service.connect()
 
             # Configure session
-            instructions = "You are bruh.bot, a Discord bot assistant. "
-            instructions += "Keep responses brief and conversational. "
-            instructions += "You're talking to people in a Discord voice channel."
-
-            if listen_to:
-                instructions += f" You're currently listening to {listen_to.display_name}."
+            instructions = _BASE_INSTRUCTIONS + (_LISTEN_ADDON.format(name=listen_to.display_name) if listen_to else "")
 
             await service.configure_session(instructions=instructions)
 
@@ -309,6 +377,17 @@ class RealTimeVoiceCog(commands.Cog):
             session["audio_queue"] = audio_queue
             service.is_running = True
 
+            # One long-lived source for the whole conversation; it emits
+            # silence between responses, so we never stop()/play() per chunk
+            streaming_source = StreamingAudioSource(self.audio_processor)
+            session["streaming_source"] = streaming_source
+
+            def after_stream(error):
+                if error:
+                    self.logger.error(f"Streaming playback error: {error}")
+
+            session["voice_client"].play(streaming_source, after=after_stream)
+
             # Start background tasks
             listen_task = asyncio.create_task(service.listen_for_response(audio_queue))
             playback_task = asyncio.create_task(self._audio_playback_task(interaction.guild.id))
@@ -332,13 +411,15 @@ class RealTimeVoiceCog(commands.Cog):
             # Cleanup on error
             if session.get("service"):
                 await session["service"].disconnect()
-            self.active_sessions[interaction.guild.id] = {"voice_client": session["voice_client"], "service": None, "sink": None, "audio_queue": None, "playback_task": None, "listen_task": None}
+            if session["voice_client"].is_playing():
+                session["voice_client"].stop()
+            self.active_sessions[interaction.guild.id] = {"voice_client": session["voice_client"], "service": None, "sink": None, "audio_queue": None, "streaming_source": None, "playback_task": None, "listen_task": None}
 
     @app_commands.command(name="voice_stop", description="Stop the current conversation.")
-    @log_command_usage()
-    @is_admin()
+    @_LOG
+    @_ADMIN
     @require_voice_channel(ephemeral=True, allow_admin_bypass=True)
-    @is_globally_blocked()
+    @_BLOCK
     async def voice_stop(self, interaction: discord.Interaction):
         """Stop the conversation."""
         session = self._get_session(interaction.guild.id)
@@ -348,9 +429,15 @@ class RealTimeVoiceCog(commands.Cog):
             return
 
         try:
-            # Stop listening
+            # Stop listening and end the long-lived playback source
             if session["voice_client"]:
                 session["voice_client"].stop_listening()
+                if session["voice_client"].is_playing():
+                    session["voice_client"].stop()
+
+            # Wake the playback task so it exits cleanly, then cancel as backup
+            if session.get("audio_queue") is not None:
+                session["audio_queue"].put_nowait(_SHUTDOWN)
 
             # Cancel tasks
             if session.get("playback_task") and not session["playback_task"].done():
@@ -375,6 +462,7 @@ class RealTimeVoiceCog(commands.Cog):
             session["service"] = None
             session["sink"] = None
             session["audio_queue"] = None
+            session["streaming_source"] = None
             session["playback_task"] = None
             session["listen_task"] = None
 
@@ -385,10 +473,10 @@ class RealTimeVoiceCog(commands.Cog):
             await interaction.followup.send(f"Error stopping conversation: {e}", ephemeral=True)
 
     @app_commands.command(name="voice_leave", description="Have the bot leave the voice channel.")
-    @log_command_usage()
-    @is_admin()
+    @_LOG
+    @_ADMIN
     @require_voice_channel(ephemeral=True, allow_admin_bypass=True)
-    @is_globally_blocked()
+    @_BLOCK
     async def voice_leave(self, interaction: discord.Interaction):
         """Leave the voice channel."""
         session = self._get_session(interaction.guild.id)
@@ -440,6 +528,7 @@ class RealTimeVoiceCog(commands.Cog):
                 self.logger.error(f"Error cleaning up session for guild {guild_id}: {e}")
 
         self.active_sessions.clear()
+        self._resample_pool.shutdown(wait=False, cancel_futures=True)
 
 
 async def setup(bot: "BruhBot"):
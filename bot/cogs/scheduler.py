@@ -1,4 +1,5 @@
-from datetime import UTC, datetime
+import heapq
+from datetime import UTC, datetime, time, timedelta
 from typing import TYPE_CHECKING
 
 import discord
@@ -12,98 +13,171 @@ from bot.utils.decarators.admin_check import is_admin
 from bot.utils.decarators.command_logging import log_command_usage
 from bot.utils.decarators.global_block_check import is_globally_blocked
 
+_LOG = log_command_usage()
+_ADMIN = is_admin()
+_BLOCK = is_globally_blocked()
+
+
 if TYPE_CHECKING:
     from bot.bruh_bot import BruhBot
 
+# How long past the fire time today's slot still counts as due, so a heap
+# rebuild or restart moments after the slot doesn't skip it until tomorrow
+_FIRE_GRACE = timedelta(minutes=10)
+
 
 class SchedulerCog(commands.Cog):
     def __init__(self, bot: "BruhBot"):
         self.bot = bot
+        # Resolved tz objects keyed by name; pytz.timezone re-parses zoneinfo
+        # data per call and check() runs every 30s for every guild
+        self._tz_cache: dict[str, pytz.BaseTzInfo] = {}
+        # Min-heap of (next_fire_utc, guild_id); the tick only does timezone
+        # math for guilds whose fire time has actually arrived. Rebuilt when
+        # the schedule-relevant config fields change.
+        self._heap: list[tuple[datetime, str]] = []
+        self._schedule_key: dict[str, tuple] | None = None
+        # Morning configs cached in-process; the set/remove commands
+        # invalidate so the next tick refetches. Saves a Mongo round-trip
+        # every 30 seconds in the steady state.
+        self._configs_cache: dict[str, dict] | None = None
         self.check.start()
 
     def cog_unload(self):
         self.check.cancel()
 
+    def _resolve_tz(self, guild_id: str, guild_tz: str) -> pytz.BaseTzInfo:
+        """Resolve a timezone name through the per-cog cache."""
+        tz = self._tz_cache.get(guild_tz)
+        if tz is None:
+            try:
+                tz = pytz.timezone(guild_tz)
+            except pytz.exceptions.UnknownTimeZoneError:
+                self.bot.logger.warning(f"Unknown timezone for guild {guild_id}: {guild_tz}, defaulting to UTC")
+                tz = pytz.UTC
+            self._tz_cache[guild_tz] = tz
+        return tz
+
+    def _next_fire(self, guild_id: str, config: dict, now_utc: datetime) -> datetime:
+        """Compute the next UTC instant this guild's morning message is due."""
+        tz = self._resolve_tz(guild_id, config.get("timezone", "UTC"))
+        now_local = now_utc.astimezone(tz)
+        fire_time = time(config.get("hour", 12), config.get("minute", 0))
+
+        # localize() resolves the offset for the target wall-clock time;
+        # replace() on now_local would carry today's offset across a DST
+        # transition and fire an hour off
+        fire_local = tz.localize(datetime.combine(now_local.date(), fire_time))
+
+        # Today's slot stays due while unsent and within the grace window
+        sent_today = config.get("last_sent_date") == now_local.date().isoformat()
+        if sent_today or now_local >= fire_local + _FIRE_GRACE:
+            fire_local = tz.localize(datetime.combine(now_local.date() + timedelta(days=1), fire_time))
+
+        return fire_local.astimezone(UTC)
+
     @tasks.loop(seconds=30)
     async def check(self):
-        """Check each guild's configured time and send messages when appropriate"""
-        morning_configs = await self.bot.morning_config_service.get_all_configs()
+        """Pop due guilds off the schedule heap and send their morning messages"""
+        if self._configs_cache is None:
+            self._configs_cache = await self.bot.morning_config_service.get_all_configs()
+        morning_configs = self._configs_cache
         if not morning_configs:
+            self._heap = []
+            self._schedule_key = None
             return
 
         now_utc = datetime.now(UTC)
 
-        for guild_id, config in morning_configs.items():
+        # Rebuild the heap only when the schedule itself changes; steady-state
+        # ticks do no per-guild timezone math at all
+        schedule_key = {guild_id: (config.get("timezone", "UTC"), config.get("hour", 12), config.get("minute", 0)) for guild_id, config in morning_configs.items()}
+        if schedule_key != self._schedule_key:
+            self._schedule_key = schedule_key
+            self._heap = [(self._next_fire(guild_id, config, now_utc), guild_id) for guild_id, config in morning_configs.items()]
+            heapq.heapify(self._heap)
+
+        while self._heap and self._heap[0][0] <= now_utc:
+            _, guild_id = heapq.heappop(self._heap)
+            config = morning_configs.get(guild_id)
+            if config is None:
+                continue
+
             try:
-                # Get the configured time in the configured timezone
-                guild_tz = config.get("timezone", "UTC")
-                try:
-                    tz = pytz.timezone(guild_tz)
-                except pytz.exceptions.UnknownTimeZoneError:
-                    self.bot.logger.warning(f"Unknown timezone for guild {guild_id}: {guild_tz}, defaulting to UTC")
-                    tz = pytz.UTC
-
-                # Get current time in the guild's timezone
-                now_in_guild_tz = now_utc.astimezone(tz)
-
-                # Check if we already sent a message today
-                last_sent = config.get("last_sent_date")
-                today = now_in_guild_tz.date().isoformat()
-
-                if last_sent == today:
-                    # Already sent today, skip
-                    continue
-
-                # Check if it's time to send the message
-                if now_in_guild_tz.hour == config.get("hour", 12) and now_in_guild_tz.minute < config.get("minute", 0) + 1:  # 1-minute window to account for loop interval
-                    channel_id = config.get("channel_id")
-                    if not channel_id:
-                        continue
-
-                    guild = self.bot.get_guild(int(guild_id))
-                    if not guild:
-                        self.bot.logger.warning(f"Could not find guild with ID {guild_id}")
-                        continue
-
-                    channel = guild.get_channel(int(channel_id))
-                    if not channel:
-                        self.bot.logger.warning(f"Could not find channel {channel_id} in guild {guild.name}")
-                        continue
-
-                    # Get per-guild services and config
-                    guild_dynamic_config = await self.bot.config_service.get_config(str(guild_id))
-                    ai_cfg = guild_dynamic_config.aiConfig
-                    provider = ai_cfg.preferredAiProvider
-                    provider_config = getattr(ai_cfg, provider, None) or ai_cfg.openrouter
-                    api_key = provider_config.get_api_key()
-                    preferred_model = provider_config.preferredModel
-
-                    # Generate motivational message
-                    messages = [
-                        Message(role="user", parts=[MessagePart(type="text", text="Generate a motivational morning message for a server or users. Feel free to thrown on curve ball quotes that don't really make sense.")]),
-                    ]
-
-                    if main_prompt := guild_dynamic_config.aiConfig.systemPrompt:
-                        self.bot.logger.info(f"Using main prompt for morning message in guild {guild.name}")
-                        main_prompt = main_prompt.replace("{{BOTNAME}}", self.bot.user.name)
-                        messages.insert(0, Message(role="system", parts=[MessagePart(type="text", text=main_prompt)]))
-
-                    # Construct gateway request
-                    req = NormalizedRequest(provider=provider, model=preferred_model, messages=messages)
-
-                    gateway = get_mesh_gateway()
-                    response = await gateway.complete(req, credentials={"api_key": api_key})
-                    content = "".join(part.content for part in response.parts if part.type == "text")
-
-                    embed = self.bot.embed_service.create_morning_embed(message=content)
-                    await channel.send(embed=embed, files=self.bot.embed_service.get_brand_files(embed=embed))
-
-                    # Mark as sent today
-                    await self.bot.morning_config_service.update_last_sent_date(guild_id, today)
-
-                    self.bot.logger.info(f"Sent morning message to {channel.name} in {guild.name}")
+                await self._send_morning_message(guild_id, config)
             except Exception as e:
                 self.bot.logger.error(f"Error sending morning message to guild {guild_id}: {e}")
+                # Retry on a later tick; rolling to _next_fire here would skip
+                # the guild for the whole day on one transient error
+                heapq.heappush(self._heap, (now_utc + timedelta(seconds=60), guild_id))
+                continue
+
+            # Reschedule for the next day (the slot just fired, so _next_fire
+            # rolls forward past it)
+            next_fire = self._next_fire(guild_id, config, now_utc)
+            if next_fire <= now_utc:
+                # Still inside the grace window with nothing sent (e.g. no
+                # channel configured); defer to a later tick instead of
+                # re-popping the same entry in this loop
+                next_fire = now_utc + timedelta(seconds=60)
+            heapq.heappush(self._heap, (next_fire, guild_id))
+
+    async def _send_morning_message(self, guild_id: str, config: dict):
+        """Generate and send the morning message for one guild."""
+        tz = self._resolve_tz(guild_id, config.get("timezone", "UTC"))
+        today = datetime.now(UTC).astimezone(tz).date().isoformat()
+
+        # Safety net against duplicate heap entries / restarts mid-window
+        if config.get("last_sent_date") == today:
+            return
+
+        channel_id = config.get("channel_id")
+        if not channel_id:
+            return
+
+        guild = self.bot.get_guild(int(guild_id))
+        if not guild:
+            self.bot.logger.warning(f"Could not find guild with ID {guild_id}")
+            return
+
+        channel = guild.get_channel(int(channel_id))
+        if not channel:
+            self.bot.logger.warning(f"Could not find channel {channel_id} in guild {guild.name}")
+            return
+
+        # Get per-guild services and config
+        guild_dynamic_config = await self.bot.config_service.get_config(str(guild_id))
+        ai_cfg = guild_dynamic_config.aiConfig
+        provider = ai_cfg.preferredAiProvider
+        provider_config = getattr(ai_cfg, provider, None) or ai_cfg.openrouter
+        api_key = provider_config.get_api_key()
+        preferred_model = provider_config.preferredModel
+
+        # Generate motivational message
+        messages = [
+            Message(role="user", parts=[MessagePart(type="text", text="Generate a motivational morning message for a server or users. Feel free to thrown on curve ball quotes that don't really make sense.")]),
+        ]
+
+        if main_prompt := guild_dynamic_config.aiConfig.systemPrompt:
+            self.bot.logger.info(f"Using main prompt for morning message in guild {guild.name}")
+            main_prompt = main_prompt.replace("{{BOTNAME}}", self.bot.user.name)
+            messages.insert(0, Message(role="system", parts=[MessagePart(type="text", text=main_prompt)]))
+
+        # Construct gateway request
+        req = NormalizedRequest(provider=provider, model=preferred_model, messages=messages)
+
+        gateway = get_mesh_gateway()
+        response = await gateway.complete(req, credentials={"api_key": api_key})
+        content = "".join(part.content for part in response.parts if part.type == "text")
+
+        embed = self.bot.embed_service.create_morning_embed(message=content)
+        await channel.send(embed=embed, files=self.bot.embed_service.get_brand_files(embed=embed))
+
+        # Mark as sent today, in Mongo and in the cached dict
+        await self.bot.morning_config_service.update_last_sent_date(guild_id, today)
+        config["last_sent_date"] = today
+
+        self.bot.logger.info(f"Sent morning message to {channel.name} in {guild.name}")
 
     @check.before_loop
     async def before_check(self):
@@ -114,9 +188,9 @@ class SchedulerCog(commands.Cog):
         description="Set the morning message channel for this server",
     )
     @app_commands.describe(channel="The channel where morning messages will be sent (defaults to current channel)")
-    @log_command_usage()
-    @is_admin()
-    @is_globally_blocked()
+    @_LOG
+    @_ADMIN
+    @_BLOCK
     async def set_morning_channel(self, interaction: discord.Interaction, channel: discord.TextChannel = None):
         """Set the morning message channel for this guild"""
         if channel is None:
@@ -124,6 +198,7 @@ class SchedulerCog(commands.Cog):
 
         # Set channel using MongoDB service
         config = await self.bot.morning_config_service.set_channel(interaction.guild.id, channel.id)
+        self._configs_cache = None
 
         timezone = config.get("timezone", "UTC")
         message = f"Morning messages will be sent to {channel.mention} at **{config['hour']}:{config['minute']:02d} {timezone}**"
@@ -142,9 +217,9 @@ class SchedulerCog(commands.Cog):
         minute="Minute (0-59)",
         timezone="Timezone (e.g., 'US/Eastern', 'Europe/London', defaults to UTC)",
     )
-    @log_command_usage()
-    @is_admin()
-    @is_globally_blocked()
+    @_LOG
+    @_ADMIN
+    @_BLOCK
     async def set_morning_time(
         self,
         interaction: discord.Interaction,
@@ -174,6 +249,7 @@ class SchedulerCog(commands.Cog):
 
         # Set time using MongoDB service
         config = await self.bot.morning_config_service.set_time(interaction.guild.id, hour, minute, timezone)
+        self._configs_cache = None
 
         # Format response based on whether channel is set
         if "channel_id" in config and config["channel_id"]:
@@ -192,12 +268,13 @@ class SchedulerCog(commands.Cog):
         name="remove_morning_channel",
         description="Remove morning messages for this server",
     )
-    @log_command_usage()
-    @is_admin()
-    @is_globally_blocked()
+    @_LOG
+    @_ADMIN
+    @_BLOCK
     async def remove_morning_channel(self, interaction: discord.Interaction):
         """Remove morning messages for this guild"""
         removed = await self.bot.morning_config_service.remove_config(interaction.guild.id)
+        self._configs_cache = None
         if removed:
             embed = self.bot.embed_service.create_success_embed("Morning messages have been disabled for this server.")
         else:
@@ -206,9 +283,9 @@ class SchedulerCog(commands.Cog):
         await interaction.followup.send(embed=embed, ephemeral=True, files=self.bot.embed_service.get_brand_files(embed=embed))
 
     @app_commands.command(name="test_morning", description="Test the morning message functionality")
-    @log_command_usage()
-    @is_admin()
-    @is_globally_blocked()
+    @_LOG
+    @_ADMIN
+    @_BLOCK
     async def test_morning_message(self, interaction: discord.Interaction):
         """Test the morning message functionality"""
         status_embed = self.bot.embed_service.create_success_embed("Starting test broadcast...", title="Test Morning Message")
@@ -252,9 +329,9 @@ class SchedulerCog(commands.Cog):
         name="list_timezones",
         description="List available timezones for morning message scheduling",
     )
-    @log_command_usage()
-    @is_admin()
-    @is_globally_blocked()
+    @_LOG
+    @_ADMIN
+    @_BLOCK
     async def list_timezones(self, interaction: discord.Interaction):
         """List common timezones that can be used"""
         common_timezones = ["UTC", "US/Eastern", "US/Central", "US/Mountain", "US/Pacific", "Europe/London", "Europe/Berlin", "Europe/Moscow", "Asia/Tokyo", "Asia/Shanghai", "Australia/Sydney", "Pacific/Auckland"]
@@ -10,6 +10,9 @@ from discord import app_commands
 from bot.utils.decarators.command_logging import log_command_usage
 from bot.utils.decarators.global_block_check import is_globally_blocked
 
+_LOG = log_command_usage()
+_BLOCK = is_globally_blocked()
+
 
 class SetUserLimitsModal(discord.ui.Modal, title="Set AI Usage Limits for User"):
     def __init__(self, user: discord.User, guild_id: int, usage_service):
@@ -129,8 +132,8 @@ class AiUsageCommand:
             description="View AI usage stats for a user",
         )
         @app_commands.describe(user="The user to check stats for")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def stats(interaction: discord.Interaction, user: discord.User):
             await interaction.response.defer(ephemeral=True)
 
@@ -162,8 +165,8 @@ class AiUsageCommand:
             description="Set AI usage limits for a specific user (opens a form)",
         )
         @app_commands.describe(user="The user to set limits for")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def set_user(interaction: discord.Interaction, user: discord.User):
             bot: BruhBot = interaction.client
             modal = SetUserLimitsModal(user, interaction.guild.id, bot.ai_usage_service)
@@ -173,8 +176,8 @@ class AiUsageCommand:
             name="set_guild",
             description="Set default AI usage limits for the entire server (opens a form)",
         )
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def set_guild(interaction: discord.Interaction):
             bot: BruhBot = interaction.client
             modal = SetGuildLimitsModal(interaction.guild.id, bot.ai_usage_service)
@@ -185,8 +188,8 @@ class AiUsageCommand:
             description="Reset AI usage counters for a specific user",
         )
         @app_commands.describe(user="The user to reset counters for")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def reset_user(interaction: discord.Interaction, user: discord.User):
             await interaction.response.defer(ephemeral=True)
 
@@ -211,8 +214,8 @@ class AiUsageCommand:
             description="Enable or disable AI usage rate limiting",
         )
         @app_commands.describe(enabled="True to enable, False to disable")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def toggle(interaction: discord.Interaction, enabled: bool):
             await interaction.response.defer(ephemeral=True)
 
@@ -237,8 +240,8 @@ class AiUsageCommand:
             name="config",
             description="View current guild-level AI usage configuration",
         )
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def config_view(interaction: discord.Interaction):
             await interaction.response.defer(ephemeral=True)
 
@@ -272,8 +275,8 @@ class AiUsageCommand:
             description="Show the AI usage leaderboard by tokens and cost",
         )
         @app_commands.describe(days="Number of days to look back (leave blank for all time)")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def leaderboard(interaction: discord.Interaction, days: int | None = None):
             await interaction.response.defer()
 
@@ -334,8 +337,8 @@ class AiUsageCommand:
             description="View your own AI usage statistics",
         )
         @app_commands.describe(days="Number of days to look back (leave blank for all time)")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def my_stats(interaction: discord.Interaction, days: int | None = None):
             await interaction.response.defer(ephemeral=True)
 
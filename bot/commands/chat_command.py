@@ -11,12 +11,15 @@ from bot.services.ai.gateway.schemas.request import Message, MessagePart, Normal
 from bot.utils.decarators.command_logging import log_command_usage
 from bot.utils.decarators.global_block_check import is_globally_blocked
 
+_LOG = log_command_usage()
+_BLOCK = is_globally_blocked()
+
 
 class ChatCommand(app_commands.Command):
     def __init__(self, tree: app_commands.CommandTree, args=None):
         @tree.command(name="chat", description="Command to chat will llms")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def chat(interaction: discord.Interaction, message: str):
             await interaction.response.defer(ephemeral=False)
 
@@ -25,7 +28,11 @@ class ChatCommand(app_commands.Command):
             if not can_request:
                 await interaction.followup.send(limit_message)
                 return
-            config = (await client.config_service.get_config(str(interaction.guild.id))).aiConfig
+            # Sync cache hit in the common case; only await (and potentially
+            # hit Mongo) when this guild's config isn't loaded yet
+            guild_id = str(interaction.guild.id)
+            dynamic_config = client.config_service.get_cached_config(guild_id) or await client.config_service.get_config(guild_id)
+            config = dynamic_config.aiConfig
 
             provider = config.preferredAiProvider
             provider_config = getattr(config, provider, None) or config.openrouter
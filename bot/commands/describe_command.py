@@ -10,6 +10,10 @@ from bot.services.ai.gateway.schemas.request import Message, MessagePart, Normal
 from bot.utils.decarators.command_logging import log_command_usage
 from bot.utils.decarators.global_block_check import is_globally_blocked
 
+_LOG = log_command_usage()
+_BLOCK = is_globally_blocked()
+
+
 logger = logging.getLogger("bot")
 
 
@@ -20,12 +24,16 @@ class DescribeResponse(BaseModel):
     description4: str = Field(description="Fourth description of the image, highly detailed Midjourney style prompt.")
 
 
+# Schema is fixed; derive the response_format once instead of per command run
+_DESCRIBE_RESPONSE_FORMAT = {"type": "json_schema", "json_schema": {"name": "DescribeResponse", "schema": DescribeResponse.model_json_schema()}}
+
+
 class DescribeCommand:
     def __init__(self, tree: app_commands.CommandTree, args=None):
         @tree.command(name="describe", description="Generate 4 Midjourney-style prompt descriptions from an image.")
         @app_commands.describe(image="The image you want to describe.")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def describe(interaction: discord.Interaction, image: discord.Attachment):
             # Defer response since describing can take a while
             await interaction.response.defer()
@@ -82,8 +90,8 @@ class DescribeCommand:
                     api_key = provider_config.get_api_key()
                     preferred_model = "google/gemini-3.1-flash-lite"
 
-                # Define structured output format
-                response_format = {"type": "json_schema", "json_schema": {"name": "DescribeResponse", "schema": DescribeResponse.model_json_schema()}}
+                # Structured output format, prebuilt at module import
+                response_format = _DESCRIBE_RESPONSE_FORMAT
 
                 system_prompt = "You are a Midjourney prompt generation expert. Describe the uploaded image in 4 different distinct prompt styles. Return your response strictly conforming to the JSON schema."
 
@@ -5,6 +5,10 @@ from bot.utils.decarators.admin_check import is_admin
 from bot.utils.decarators.command_logging import log_command_usage
 from bot.utils.decarators.global_block_check import is_globally_blocked
 
+_LOG = log_command_usage()
+_ADMIN = is_admin()
+_BLOCK = is_globally_blocked()
+
 
 class EchoCommand(app_commands.Command):
     def __init__(self, tree: app_commands.CommandTree, args=None):
@@ -12,9 +16,9 @@ class EchoCommand(app_commands.Command):
             name="echo",
             description="Send a message as the bot with optional attachment",
         )
-        @log_command_usage()
-        @is_admin()
-        @is_globally_blocked()
+        @_LOG
+        @_ADMIN
+        @_BLOCK
         async def echo(
             interaction: discord.Interaction,
             message: str | None = None,
@@ -29,7 +33,13 @@ class EchoCommand(app_commands.Command):
                 )
                 return
 
+            kwargs = {}
+            if message:
+                kwargs["content"] = message
             if attachment:
-                await channel.send(content=message or "", file=await attachment.to_file())
-            else:
-                await channel.send(content=message)
+                kwargs["file"] = await attachment.to_file()
+            await channel.send(**kwargs)
+
+            # is_admin deferred the interaction; resolve it so the user isn't
+            # left on "thinking..." until the token expires
+            await interaction.followup.send("Message sent!", ephemeral=True)
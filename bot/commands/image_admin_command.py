@@ -1,3 +1,4 @@
+import asyncio
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -9,6 +10,9 @@ from discord import app_commands
 from bot.utils.decarators.command_logging import log_command_usage
 from bot.utils.decarators.global_block_check import is_globally_blocked
 
+_LOG = log_command_usage()
+_BLOCK = is_globally_blocked()
+
 
 class ImageAdminCommand:
     def __init__(self, tree: app_commands.CommandTree, args=None):
@@ -23,16 +27,18 @@ class ImageAdminCommand:
             description="Reset image generation limit for a specific user",
         )
         @app_commands.describe(user="The user to reset limits for")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def reset_user(interaction: discord.Interaction, user: discord.User):
             """Reset a specific user's image generation limit."""
-            await interaction.response.defer(ephemeral=True)
-
             bot: BruhBot = interaction.client
 
             try:
-                bot.image_limit_service.reset_user(user_id=user.id, guild_id=interaction.guild.id)
+                # These service methods are coroutines; start the Mongo op so
+                # it overlaps the defer ACK, then await the result
+                reset_task = asyncio.create_task(bot.image_limit_service.reset_user(user_id=user.id, guild_id=interaction.guild.id))
+                await interaction.response.defer(ephemeral=True)
+                await reset_task
 
                 embed = interaction.client.embed_service.create_success_embed(f"Image generation limit has been reset for {user.mention}", title="User Limit Reset")
 
@@ -46,16 +52,16 @@ class ImageAdminCommand:
             name="reset_all",
             description="Reset image generation limits for all users in this server",
         )
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def reset_all(interaction: discord.Interaction):
             """Reset all users' image generation limits."""
-            await interaction.response.defer(ephemeral=True)
-
             bot: BruhBot = interaction.client
 
             try:
-                count = bot.image_limit_service.reset_all_users(guild_id=interaction.guild.id)
+                reset_task = asyncio.create_task(bot.image_limit_service.reset_all_users(guild_id=interaction.guild.id))
+                await interaction.response.defer(ephemeral=True)
+                count = await reset_task
 
                 embed = interaction.client.embed_service.create_success_embed(f"Image generation limits have been reset for {count} user(s)", title="All Limits Reset")
 
@@ -70,8 +76,8 @@ class ImageAdminCommand:
             description="Set the daily image generation limit for a specific user",
         )
         @app_commands.describe(user="The user to set the limit for", limit="The new maximum daily image limit for this user")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def set_user_limit(interaction: discord.Interaction, user: discord.User, limit: int):
             """Set the daily image generation limit for a specific user."""
             await interaction.response.defer(ephemeral=True)
@@ -83,7 +89,7 @@ class ImageAdminCommand:
                     await interaction.followup.send("Limit must be at least 1.", ephemeral=True)
                     return
 
-                success = bot.image_limit_service.set_user_limit(user.id, interaction.guild.id, limit)
+                success = await bot.image_limit_service.set_user_limit(user.id, interaction.guild.id, limit)
 
                 if success:
                     embed = interaction.client.embed_service.create_success_embed(f"Daily image limit for {user.mention} set to **{limit}** images", title="User Limit Updated")
@@ -101,8 +107,8 @@ class ImageAdminCommand:
             description="Set the daily image generation limit for all users in this server",
         )
         @app_commands.describe(limit="The new maximum daily image limit for all users")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def set_guild_limit(interaction: discord.Interaction, limit: int):
             """Set the daily image generation limit for all users in the guild."""
             await interaction.response.defer(ephemeral=True)
@@ -114,7 +120,7 @@ class ImageAdminCommand:
                     await interaction.followup.send("Limit must be at least 1.", ephemeral=True)
                     return
 
-                count = bot.image_limit_service.set_guild_limit(interaction.guild.id, limit)
+                count = await bot.image_limit_service.set_guild_limit(interaction.guild.id, limit)
 
                 embed = interaction.client.embed_service.create_success_embed(f"Daily image limit set to **{limit}** for {count} user(s) in this server", title="Guild Limit Updated")
                 embed.add_field(name="Note", value="New users will receive the default limit from config unless changed individually.", inline=False)
@@ -130,16 +136,16 @@ class ImageAdminCommand:
             description="View the daily image generation limit for a specific user",
         )
         @app_commands.describe(user="The user to check the limit for")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def view_user_limit(interaction: discord.Interaction, user: discord.User):
             """View the daily image generation limit for a specific user."""
-            await interaction.response.defer(ephemeral=True)
-
             bot: BruhBot = interaction.client
 
             try:
-                stats = bot.image_limit_service.get_user_stats(user.id, interaction.guild.id)
+                stats_task = asyncio.create_task(bot.image_limit_service.get_user_stats(user.id, interaction.guild.id))
+                await interaction.response.defer(ephemeral=True)
+                stats = await stats_task
                 user_limit = stats["max_daily_images"]
                 count = stats["count"]
                 remaining = stats["remaining"]
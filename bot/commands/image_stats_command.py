@@ -6,6 +6,10 @@ from discord import app_commands
 from bot.utils.decarators.command_logging import log_command_usage
 from bot.utils.decarators.global_block_check import is_globally_blocked
 
+_LOG = log_command_usage()
+_BLOCK = is_globally_blocked()
+
+
 if TYPE_CHECKING:
     from bot.bruh_bot import BruhBot
 
@@ -16,8 +20,8 @@ class ImageStatsCommand:
             name="image_stats",
             description="Check your remaining daily image generation limit",
         )
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def image_stats(interaction: discord.Interaction):
             """Check the user's image generation stats."""
             await interaction.response.defer(ephemeral=True)
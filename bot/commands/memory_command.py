@@ -11,6 +11,11 @@ from bot.utils.decarators.admin_check import is_admin
 from bot.utils.decarators.command_logging import log_command_usage
 from bot.utils.decarators.global_block_check import is_globally_blocked
 
+_LOG = log_command_usage()
+_ADMIN = is_admin()
+_BLOCK = is_globally_blocked()
+
+
 MEMORIES_PER_PAGE = 10
 
 
@@ -26,8 +31,8 @@ class MemoryCommand:
             description="View the memories stored about you",
         )
         @app_commands.describe(page="Page number to display")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def view_memories(interaction: discord.Interaction, page: int = 1):
             await interaction.response.defer(ephemeral=True)
 
@@ -97,9 +102,9 @@ class MemoryCommand:
             category=f"The memory category ({', '.join(VALID_CATEGORIES)})",
             target_user="Target user for relationship memories (who the memory is about)",
         )
-        @is_admin()
-        @log_command_usage()
-        @is_globally_blocked()
+        @_ADMIN
+        @_LOG
+        @_BLOCK
         async def add_memory(interaction: discord.Interaction, user: discord.User, text: str, category: str = "fact", target_user: discord.User | None = None):
             bot: BruhBot = interaction.client
 
@@ -133,9 +138,9 @@ class MemoryCommand:
             description="Remove a specific memory by ID",
         )
         @app_commands.describe(memory_id="The ID of the memory to remove")
-        @is_admin()
-        @log_command_usage()
-        @is_globally_blocked()
+        @_ADMIN
+        @_LOG
+        @_BLOCK
         async def remove_memory(interaction: discord.Interaction, memory_id: str):
             bot: BruhBot = interaction.client
 
@@ -168,9 +173,9 @@ class MemoryCommand:
             category=f"Filter by category ({', '.join(VALID_CATEGORIES)}) or leave empty for all",
             page="Page number",
         )
-        @is_admin()
-        @log_command_usage()
-        @is_globally_blocked()
+        @_ADMIN
+        @_LOG
+        @_BLOCK
         async def list_memories(interaction: discord.Interaction, user: discord.User, category: str | None = None, page: int = 1):
             bot: BruhBot = interaction.client
 
@@ -214,9 +219,9 @@ class MemoryCommand:
             description="Remove all memories for a user",
         )
         @app_commands.describe(user="The user to clear memories for")
-        @is_admin()
-        @log_command_usage()
-        @is_globally_blocked()
+        @_ADMIN
+        @_LOG
+        @_BLOCK
         async def clear_memories(interaction: discord.Interaction, user: discord.User):
             bot: BruhBot = interaction.client
 
@@ -241,9 +246,9 @@ class MemoryCommand:
             description="Enable or disable automatic memory extraction",
         )
         @app_commands.describe(enabled="Whether to enable or disable memory extraction")
-        @is_admin()
-        @log_command_usage()
-        @is_globally_blocked()
+        @_ADMIN
+        @_LOG
+        @_BLOCK
         async def toggle_memory(interaction: discord.Interaction, enabled: bool):
             bot: BruhBot = interaction.client
 
@@ -272,9 +277,9 @@ class MemoryCommand:
             name="extract_now",
             description="Force immediate memory extraction for all users",
         )
-        @is_admin()
-        @log_command_usage()
-        @is_globally_blocked()
+        @_ADMIN
+        @_LOG
+        @_BLOCK
         async def extract_now(interaction: discord.Interaction):
             bot: BruhBot = interaction.client
 
@@ -298,9 +303,9 @@ class MemoryCommand:
             description="Force immediate memory extraction for a specific user",
         )
         @app_commands.describe(user="The user to extract memories for")
-        @is_admin()
-        @log_command_usage()
-        @is_globally_blocked()
+        @_ADMIN
+        @_LOG
+        @_BLOCK
         async def extract_user(interaction: discord.Interaction, user: discord.User):
             bot: BruhBot = interaction.client
 
@@ -4,13 +4,20 @@ from discord import app_commands
 from bot.utils.decarators.command_logging import log_command_usage
 from bot.utils.decarators.global_block_check import is_globally_blocked
 
+_LOG = log_command_usage()
+_BLOCK = is_globally_blocked()
+
 
 class PingCommand:
     def __init__(self, tree: app_commands.CommandTree, args=None):
         @tree.command(name="ping", description="Ping the bot to get it's latency.")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def ping(interaction: discord.Interaction):
+            # Ack immediately - defer extends the 3s response window to 15min,
+            # so event-loop lag can't invalidate the interaction token (10062)
+            if not interaction.response.is_done():
+                await interaction.response.defer()
             latency = round(interaction.client.latency * 1000)
             embed = interaction.client.embed_service.create_success_embed(f"📡 Signal Latency: **{latency}ms**", title="Pong!")
-            await interaction.response.send_message(embed=embed, files=interaction.client.embed_service.get_brand_files(embed=embed))
+            await interaction.followup.send(embed=embed, files=interaction.client.embed_service.get_brand_files(embed=embed))
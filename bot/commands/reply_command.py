@@ -1,3 +1,5 @@
+import asyncio
+
 import discord
 from discord import app_commands
 
@@ -5,6 +7,10 @@ from bot.utils.decarators.admin_check import is_admin
 from bot.utils.decarators.command_logging import log_command_usage
 from bot.utils.decarators.global_block_check import is_globally_blocked
 
+_LOG = log_command_usage()
+_ADMIN = is_admin()
+_BLOCK = is_globally_blocked()
+
 
 class ReplyCommand(app_commands.Command):
     def __init__(self, tree: app_commands.CommandTree, args=None):
@@ -12,9 +18,9 @@ class ReplyCommand(app_commands.Command):
             name="reply",
             description="Reply to a message as the bot with optional attachment and text",
         )
-        @log_command_usage()
-        @is_admin()
-        @is_globally_blocked()
+        @_LOG
+        @_ADMIN
+        @_BLOCK
         async def reply(
             interaction: discord.Interaction,
             message_id: str,
@@ -32,30 +38,39 @@ class ReplyCommand(app_commands.Command):
                 return
 
             try:
-                target_message = await channel.fetch_message(int(message_id))
-            except discord.NotFound:
+                parsed_id = int(message_id)
+            except ValueError:
                 await interaction.followup.send(
-                    "Message not found in this channel. Please ensure the Message ID is correct.",
+                    "Invalid Message ID. Please provide a numeric ID.",
                     ephemeral=True,
                 )
                 return
-            except ValueError:
+
+            # The CDN download of the attachment and the API fetch of the
+            # target message are independent; overlap them
+            file_task = asyncio.create_task(attachment.to_file()) if attachment else None
+
+            try:
+                target_message = await channel.fetch_message(parsed_id)
+            except discord.NotFound:
+                if file_task:
+                    file_task.cancel()
                 await interaction.followup.send(
-                    "Invalid Message ID. Please provide a numeric ID.",
+                    "Message not found in this channel. Please ensure the Message ID is correct.",
                     ephemeral=True,
                 )
                 return
 
             try:
-                file_to_send = None
-                if attachment:
-                    file_to_send = await attachment.to_file()
-
-                await target_message.reply(
-                    content=message or "",
-                    file=file_to_send,
-                    mention_author=False,  # Set to True if you want the bot to mention the original author
-                )
+                # Only pass the fields that are set - no empty-string content
+                # or explicit file=None in the outbound payload
+                kwargs = {"mention_author": False}  # Set to True if you want the bot to mention the original author
+                if message:
+                    kwargs["content"] = message
+                if file_task:
+                    kwargs["file"] = await file_task
+
+                await target_message.reply(**kwargs)
                 await interaction.followup.send("Reply sent!", ephemeral=True)
             except Exception as e:
                 await interaction.followup.send(f"An error occurred: {e}", ephemeral=True)
@@ -7,6 +7,11 @@ from bot.utils.decarators.admin_check import is_admin
 from bot.utils.decarators.command_logging import log_command_usage
 from bot.utils.decarators.global_block_check import is_globally_blocked
 
+_LOG = log_command_usage()
+_ADMIN = is_admin()
+_BLOCK = is_globally_blocked()
+
+
 if TYPE_CHECKING:
     from bot.bruh_bot import BruhBot
 
@@ -17,8 +22,8 @@ class ReputationCommand:
 
         @group.command(name="leaderboard", description="Show the lowest reputation scores in this server")
         @app_commands.describe(limit="How many users to show")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def leaderboard(interaction: discord.Interaction, limit: app_commands.Range[int, 1, 25] = 10):
             bot: BruhBot = interaction.client
             entries = await bot.reputation_service.get_leaderboard(interaction.guild.id, limit)
@@ -38,8 +43,8 @@ class ReputationCommand:
             await interaction.response.send_message(embed=embed, files=bot.embed_service.get_brand_files(embed=embed))
 
         @group.command(name="me", description="View your reputation in this server")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def me(interaction: discord.Interaction):
             bot: BruhBot = interaction.client
             profile = await bot.reputation_service.get_profile(interaction.guild.id, interaction.user.id)
@@ -53,9 +58,9 @@ class ReputationCommand:
 
         @group.command(name="view", description="View a user's reputation and recent audit entries")
         @app_commands.describe(user="The user to inspect")
-        @log_command_usage()
-        @is_admin()
-        @is_globally_blocked()
+        @_LOG
+        @_ADMIN
+        @_BLOCK
         async def view(interaction: discord.Interaction, user: discord.User):
             bot: BruhBot = interaction.client
             profile = await bot.reputation_service.get_profile(interaction.guild.id, user.id)
@@ -66,9 +71,9 @@ class ReputationCommand:
 
         @group.command(name="set-score", description="Set a user's reputation score")
         @app_commands.describe(user="The user to update", score="New signed score", reason="Reason for the manual adjustment")
-        @log_command_usage()
-        @is_admin()
-        @is_globally_blocked()
+        @_LOG
+        @_ADMIN
+        @_BLOCK
         async def set_score(interaction: discord.Interaction, user: discord.User, score: app_commands.Range[int, -10000, 10000], reason: str = "Manual admin adjustment"):
             bot: BruhBot = interaction.client
             profile = await bot.reputation_service.set_score(interaction.guild.id, user.id, score, reason)
@@ -76,9 +81,9 @@ class ReputationCommand:
 
         @group.command(name="block", description="Manually block a user from bot interactions")
         @app_commands.describe(user="The user to block", reason="Reason for the block")
-        @log_command_usage()
-        @is_admin()
-        @is_globally_blocked()
+        @_LOG
+        @_ADMIN
+        @_BLOCK
         async def block(interaction: discord.Interaction, user: discord.User, reason: str = "Manual admin block"):
             bot: BruhBot = interaction.client
             await bot.reputation_service.set_manual_block(interaction.guild.id, user.id, True, reason)
@@ -86,9 +91,9 @@ class ReputationCommand:
 
         @group.command(name="unblock", description="Restore a user's ability to interact with the bot")
         @app_commands.describe(user="The user to unblock", reason="Reason for the unblock")
-        @log_command_usage()
-        @is_admin()
-        @is_globally_blocked()
+        @_LOG
+        @_ADMIN
+        @_BLOCK
         async def unblock(interaction: discord.Interaction, user: discord.User, reason: str = "Manual admin unblock"):
             bot: BruhBot = interaction.client
             await bot.reputation_service.set_manual_block(interaction.guild.id, user.id, False, reason)
@@ -13,6 +13,10 @@ from discord import app_commands
 from bot.utils.decarators.command_logging import log_command_usage
 from bot.utils.decarators.global_block_check import is_globally_blocked
 
+_LOG = log_command_usage()
+_BLOCK = is_globally_blocked()
+
+
 logger = logging.getLogger("bot")
 
 # ── Shop Constants ──────────────────────────────────────────────
@@ -128,8 +132,8 @@ class ShopCommands:
                 app_commands.Choice(name="Mystery Box — 500 coins", value="mystery_box"),
             ]
         )
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def buy(interaction: discord.Interaction, item: str):
             await interaction.response.defer(ephemeral=True)
             bot = _get_bot(interaction)
@@ -177,8 +181,8 @@ class ShopCommands:
 
         # ── /shop status ───────────────────────────────────────
         @shop.command(name="status", description="Check your active boosters and coin balance.")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def status(interaction: discord.Interaction):
             await interaction.response.defer(ephemeral=True)
             bot = _get_bot(interaction)
@@ -213,8 +217,8 @@ class ShopCommands:
                 app_commands.Choice(name="Tails", value="tails"),
             ]
         )
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def coinflip(interaction: discord.Interaction, amount: int, choice: str, turns: app_commands.Range[int, 1, MAX_BATCH_TURNS] = 1):
             await interaction.response.defer()
             bot = _get_bot(interaction)
@@ -293,8 +297,8 @@ class ShopCommands:
         # ── /dice ──────────────────────────────────────────────
         @tree.command(name="dice", description="Roll a die against the bot!")
         @app_commands.describe(bet="Amount to bet", turns=f"Number of turns to play (1-{MAX_BATCH_TURNS})")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def dice(interaction: discord.Interaction, bet: int, turns: app_commands.Range[int, 1, MAX_BATCH_TURNS] = 1):
             await interaction.response.defer()
             bot = _get_bot(interaction)
@@ -382,8 +386,8 @@ class ShopCommands:
         # ── /slots ─────────────────────────────────────────────
         @tree.command(name="slots", description="Play the slot machine!")
         @app_commands.describe(bet="Amount to bet", turns=f"Number of turns to play (1-{MAX_BATCH_TURNS})")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def slots(interaction: discord.Interaction, bet: int, turns: app_commands.Range[int, 1, MAX_BATCH_TURNS] = 1):
             await interaction.response.defer()
             bot = _get_bot(interaction)
@@ -474,8 +478,8 @@ class ShopCommands:
         # ── /gift ──────────────────────────────────────────────
         @tree.command(name="gift", description="Send bruh.coins to another user.")
         @app_commands.describe(user="The user to send coins to", amount="Amount to send")
-        @log_command_usage()
-        @is_globally_blocked()
+        @_LOG
+        @_BLOCK
         async def gift(interaction: discord.Interaction, user: discord.User, amount: int):
             await interaction.response.defer(ephemeral=True)
             bot = _get_bot(interaction)
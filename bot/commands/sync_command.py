@@ -5,6 +5,10 @@ from bot.utils.decarators.admin_check import is_admin
 from bot.utils.decarators.command_logging import log_command_usage
 from bot.utils.decarators.global_block_check import is_globally_blocked
 
+_LOG = log_command_usage()
+_ADMIN = is_admin()
+_BLOCK = is_globally_blocked()
+
 
 class SyncCommand(app_commands.Group):
     def __init__(self, tree: discord.app_commands.CommandTree, args=None):
@@ -12,9 +16,9 @@ class SyncCommand(app_commands.Group):
             name="sync",
             description="Command to sync the slash commands with the guild.",
         )
-        @log_command_usage()
-        @is_admin()
-        @is_globally_blocked()
+        @_LOG
+        @_ADMIN
+        @_BLOCK
         async def sync(interaction: discord.Interaction):
             try:
                 await tree.sync()
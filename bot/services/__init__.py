@@ -1,79 +1,145 @@
-from .ai.ai_orchestrator import AiOrchestrator
-from .ai.embedding_service import EmbeddingService
-from .ai.image_generation_service import ImageGenerationService
-from .ai.real_time_audio_service import (
-    AudioProcessor,
-    RealTimeAudioService,
-    VoiceReceiveSink,
-)
-from .ai.types import ImageGenerationResponse, UserIntent
-from .config_service import BaseConfig, ConfigService, DynamicConfig, EconomyConfig, MemoryConfig, ReputationConfig, get_config_service
-from .cooldown_service import CooldownService
-from .discord_messages_service import DiscordMessagesService
-from .embed_service import ConfirmView, EmbedService, NowPlayingView, QueuePaginationView
-from .memory_extraction_service import MemoryExtractionService
-from .memory_tools import MEMORY_TOOL_SCHEMAS, MemoryToolExecutor
-from .message_service import MessageService
-from .mongo_ai_usage_service import MongoAIUsageService
-from .mongo_ai_usage_tracking_service import MongoAIUsageTrackingService
-from .mongo_chat_service import MongoChatService
-from .mongo_economy_service import MongoEconomyService
-from .mongo_extraction_queue_service import MongoExtractionQueueService
-from .mongo_guild_member_service import MongoGuildMemberService
-from .mongo_image_limit_service import MongoImageLimitService
-from .mongo_memory_service import MongoMemoryService
-from .mongo_morning_config_service import MongoMorningConfigService
-from .mongo_reputation_queue_service import MongoReputationQueueService
-from .mongo_reputation_service import MongoReputationService
-from .music.audio_service import AudioService
-from .music.music_queue_service import MusicPlayer, MusicQueueService
-from .music.types import AudioMetaData, AudioSource, FilterPreset
-from .reputation_extraction_service import ReputationExtractionService
-from .response_service import ResponseService
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "MusicPlayer",
-    "MusicQueueService",
-    "AudioService",
-    "AudioMetaData",
-    "EmbedService",
-    "AudioSource",
-    "FilterPreset",
-    "QueuePaginationView",
-    "NowPlayingView",
-    "ConfirmView",
-    "AiOrchestrator",
-    "UserIntent",
-    "ImageGenerationService",
-    "ImageGenerationResponse",
-    "get_config_service",
-    "BaseConfig",
-    "DynamicConfig",
-    "MemoryConfig",
-    "ConfigService",
-    "MessageService",
-    "ResponseService",
-    "CooldownService",
-    "MongoAIUsageService",
-    "MongoEconomyService",
-    "MongoImageLimitService",
-    "MongoGuildMemberService",
-    "MongoAIUsageTrackingService",
-    "MongoMorningConfigService",
-    "MongoChatService",
-    "MongoMemoryService",
-    "MongoExtractionQueueService",
-    "RealTimeAudioService",
-    "VoiceReceiveSink",
-    "AudioProcessor",
-    "DiscordMessagesService",
-    "MemoryExtractionService",
-    "EmbeddingService",
-    "MemoryToolExecutor",
-    "MEMORY_TOOL_SCHEMAS",
-    "EconomyConfig",
-    "ReputationConfig",
-    "MongoReputationQueueService",
-    "MongoReputationService",
-    "ReputationExtractionService",
-]
+if TYPE_CHECKING:
+    # Redundant X as X aliases mark these as intentional re-exports so the
+    # type-checking-only block stays lint-clean (F401)
+    from .ai.ai_orchestrator import AiOrchestrator as AiOrchestrator
+    from .ai.embedding_service import EmbeddingService as EmbeddingService
+    from .ai.image_generation_service import ImageGenerationService as ImageGenerationService
+    from .ai.real_time_audio_service import (
+        AudioProcessor as AudioProcessor,
+    )
+    from .ai.real_time_audio_service import (
+        RealTimeAudioService as RealTimeAudioService,
+    )
+    from .ai.real_time_audio_service import (
+        VoiceReceiveSink as VoiceReceiveSink,
+    )
+    from .ai.types import ImageGenerationResponse as ImageGenerationResponse
+    from .ai.types import UserIntent as UserIntent
+    from .config_service import (
+        BaseConfig as BaseConfig,
+    )
+    from .config_service import (
+        ConfigService as ConfigService,
+    )
+    from .config_service import (
+        DynamicConfig as DynamicConfig,
+    )
+    from .config_service import (
+        EconomyConfig as EconomyConfig,
+    )
+    from .config_service import (
+        MemoryConfig as MemoryConfig,
+    )
+    from .config_service import (
+        ReputationConfig as ReputationConfig,
+    )
+    from .config_service import (
+        get_config_service as get_config_service,
+    )
+    from .cooldown_service import CooldownService as CooldownService
+    from .discord_messages_service import DiscordMessagesService as DiscordMessagesService
+    from .embed_service import (
+        ConfirmView as ConfirmView,
+    )
+    from .embed_service import (
+        EmbedService as EmbedService,
+    )
+    from .embed_service import (
+        NowPlayingView as NowPlayingView,
+    )
+    from .embed_service import (
+        QueuePaginationView as QueuePaginationView,
+    )
+    from .memory_extraction_service import MemoryExtractionService as MemoryExtractionService
+    from .memory_tools import MEMORY_TOOL_SCHEMAS as MEMORY_TOOL_SCHEMAS
+    from .memory_tools import MemoryToolExecutor as MemoryToolExecutor
+    from .message_service import MessageService as MessageService
+    from .mongo_ai_usage_service import MongoAIUsageService as MongoAIUsageService
+    from .mongo_ai_usage_tracking_service import MongoAIUsageTrackingService as MongoAIUsageTrackingService
+    from .mongo_chat_service import MongoChatService as MongoChatService
+    from .mongo_economy_service import MongoEconomyService as MongoEconomyService
+    from .mongo_extraction_queue_service import MongoExtractionQueueService as MongoExtractionQueueService
+    from .mongo_guild_member_service import MongoGuildMemberService as MongoGuildMemberService
+    from .mongo_image_limit_service import MongoImageLimitService as MongoImageLimitService
+    from .mongo_memory_service import MongoMemoryService as MongoMemoryService
+    from .mongo_morning_config_service import MongoMorningConfigService as MongoMorningConfigService
+    from .mongo_reputation_queue_service import MongoReputationQueueService as MongoReputationQueueService
+    from .mongo_reputation_service import MongoReputationService as MongoReputationService
+    from .music.audio_service import AudioService as AudioService
+    from .music.music_queue_service import MusicPlayer as MusicPlayer
+    from .music.music_queue_service import MusicQueueService as MusicQueueService
+    from .music.types import AudioMetaData as AudioMetaData
+    from .music.types import AudioSource as AudioSource
+    from .music.types import FilterPreset as FilterPreset
+    from .reputation_extraction_service import ReputationExtractionService as ReputationExtractionService
+    from .response_service import ResponseService as ResponseService
+
+# Submodule that provides each public name. Resolved lazily (PEP 562) so
+# importing the package - e.g. the config API pulling in config_service -
+# doesn't eagerly load PIL, pymongo, numpy, and the AI SDKs; each consumer
+# pays only for the submodules it actually uses.
+_EXPORTS = {
+    "AiOrchestrator": ".ai.ai_orchestrator",
+    "EmbeddingService": ".ai.embedding_service",
+    "ImageGenerationService": ".ai.image_generation_service",
+    "AudioProcessor": ".ai.real_time_audio_service",
+    "RealTimeAudioService": ".ai.real_time_audio_service",
+    "VoiceReceiveSink": ".ai.real_time_audio_service",
+    "ImageGenerationResponse": ".ai.types",
+    "UserIntent": ".ai.types",
+    "BaseConfig": ".config_service",
+    "ConfigService": ".config_service",
+    "DynamicConfig": ".config_service",
+    "EconomyConfig": ".config_service",
+    "MemoryConfig": ".config_service",
+    "ReputationConfig": ".config_service",
+    "get_config_service": ".config_service",
+    "CooldownService": ".cooldown_service",
+    "DiscordMessagesService": ".discord_messages_service",
+    "ConfirmView": ".embed_service",
+    "EmbedService": ".embed_service",
+    "NowPlayingView": ".embed_service",
+    "QueuePaginationView": ".embed_service",
+    "MemoryExtractionService": ".memory_extraction_service",
+    "MEMORY_TOOL_SCHEMAS": ".memory_tools",
+    "MemoryToolExecutor": ".memory_tools",
+    "MessageService": ".message_service",
+    "MongoAIUsageService": ".mongo_ai_usage_service",
+    "MongoAIUsageTrackingService": ".mongo_ai_usage_tracking_service",
+    "MongoChatService": ".mongo_chat_service",
+    "MongoEconomyService": ".mongo_economy_service",
+    "MongoExtractionQueueService": ".mongo_extraction_queue_service",
+    "MongoGuildMemberService": ".mongo_guild_member_service",
+    "MongoImageLimitService": ".mongo_image_limit_service",
+    "MongoMemoryService": ".mongo_memory_service",
+    "MongoMorningConfigService": ".mongo_morning_config_service",
+    "MongoReputationQueueService": ".mongo_reputation_queue_service",
+    "MongoReputationService": ".mongo_reputation_service",
+    "AudioService": ".music.audio_service",
+    "MusicPlayer": ".music.music_queue_service",
+    "MusicQueueService": ".music.music_queue_service",
+    "AudioMetaData": ".music.types",
+    "AudioSource": ".music.types",
+    "FilterPreset": ".music.types",
+    "ReputationExtractionService": ".reputation_extraction_service",
+    "ResponseService": ".response_service",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -1,4 +1,10 @@
+import asyncio
+import hashlib
 import logging
+import re
+import string
+import unicodedata
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 from bot.services.ai.gateway.gateway import get_mesh_gateway
@@ -9,28 +15,24 @@ from .types import UserIntent
 if TYPE_CHECKING:
     from bot.bruh_bot import BruhBot
 
+_INTENT_CACHE_SIZE = 4096
 
-class AiOrchestrator:
-    def __init__(self, bot: "BruhBot"):
-        self.bot = bot
-        self.logger = logging.getLogger(__name__)
+# Key normalization for the intent cache: NFKC folds unicode lookalikes,
+# casefold beats lower() for non-ASCII, and stripping punctuation lets
+# "make it darker!" share a slot with "make it DARKER"
+_PUNCT_TBL = str.maketrans("", "", string.punctuation)
+_WS_RE = re.compile(r"\s+")
 
-    async def detect_intent(self, guild_id: int, user_message: str, is_replying_to_bot_image: bool = False) -> UserIntent:
-        """
-        Detect if the user wants to chat or generate an image.
 
-        Args:
-            user_message: The user's message
-            is_replying_to_bot_image: Whether the user is replying to a bot message containing an image
+def _normalize_message(msg: str) -> str:
+    return _WS_RE.sub(" ", unicodedata.normalize("NFKC", msg).casefold().translate(_PUNCT_TBL)).strip()
 
-        Returns:
-            UserIntent: Either "chat" or "image_generation"
-        """
-        context_note = ""
-        if is_replying_to_bot_image:
-            context_note = "\n\nIMPORTANT: The user is replying to a bot message that contains an image. This strongly suggests they want to edit or modify that image, unless their message clearly indicates otherwise (e.g., asking a question about the image)."
 
-        system_prompt = f"""You are an intent classifier. Determine if the user wants to:
+# Static classifier prompt, byte-identical across calls. Kept at the head of
+# the message list so OpenAI-compatible backends can reuse their prompt-prefix
+# cache (and Ollama its KV prefix); the per-call context note goes in a
+# separate trailing system message instead of being formatted into this one.
+_INTENT_SYSTEM_PROMPT = """You are an intent classifier. Determine if the user wants to:
 - chat: Have a conversation, ask questions, get information
 - image_generation: Create, generate, make, edit, or modify an image/picture/photo
 
@@ -43,28 +45,88 @@ Examples of image_generation:
 - "add a hat to this" (when replying to an image)
 - "change the background to blue" (when replying to an image)
 
-Everything else is chat.{context_note}"""
+Everything else is chat."""
+
+_IMAGE_REPLY_NOTE = "IMPORTANT: The user is replying to a bot message that contains an image. This strongly suggests they want to edit or modify that image, unless their message clearly indicates otherwise (e.g., asking a question about the image)."
+
+# model_json_schema() walks the model on every call; the schema is fixed at
+# import time, so derive the response_format once and reuse the dict
+_USER_INTENT_RESPONSE_FORMAT = {"type": "json_schema", "json_schema": {"name": "UserIntent", "schema": UserIntent.model_json_schema()}}
+
+
+class AiOrchestrator:
+    __slots__ = ("bot", "logger", "_intent_cache", "_inflight", "_intent_hits", "_intent_misses")
 
-        orchestrator_config = (await self.bot.config_service.get_config(str(guild_id))).aiConfig.orchestrator
+    def __init__(self, bot: "BruhBot"):
+        self.bot = bot
+        self.logger = logging.getLogger(__name__)
+        # LRU of classifier results. Intent is a deterministic function of
+        # (provider, model, reply-to-image flag, message) and short prompts
+        # repeat verbatim ("draw a cat", "make it darker"), so a hit skips
+        # the classifier LLM round-trip entirely.
+        self._intent_cache: OrderedDict[tuple, UserIntent] = OrderedDict()
+        # Single-flight map: when a burst of messages carries the same
+        # prompt, the second+ callers await the first classification instead
+        # of each launching their own gateway request.
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        self._intent_hits = 0
+        self._intent_misses = 0
+
+    @staticmethod
+    def _intent_cache_key(provider: str, model: str, is_replying_to_bot_image: bool, user_message: str) -> tuple:
+        digest = hashlib.blake2b(_normalize_message(user_message).encode(), digest_size=16).digest()
+        return (provider, model, is_replying_to_bot_image, digest)
+
+    async def detect_intent(self, guild_id: int, user_message: str, is_replying_to_bot_image: bool = False) -> UserIntent:
+        """
+        Detect if the user wants to chat or generate an image.
+
+        Args:
+            user_message: The user's message
+            is_replying_to_bot_image: Whether the user is replying to a bot message containing an image
+
+        Returns:
+            UserIntent: Either "chat" or "image_generation"
+        """
         ai_cfg = (await self.bot.config_service.get_config(str(guild_id))).aiConfig
+        orchestrator_config = ai_cfg.orchestrator
 
         provider = orchestrator_config.preferredAiProvider
         provider_config = getattr(ai_cfg, provider, None) or ai_cfg.openrouter
         api_key = provider_config.get_api_key()
         preferred_model = orchestrator_config.preferredModel or provider_config.preferredModel
 
-        # Construct JSON schema response format
-        response_format = {"type": "json_schema", "json_schema": {"name": "UserIntent", "schema": UserIntent.model_json_schema()}}
-
+        cache_key = self._intent_cache_key(provider, preferred_model, is_replying_to_bot_image, user_message)
+        cached = self._intent_cache.get(cache_key)
+        if cached is not None:
+            self._intent_hits += 1
+            self._intent_cache.move_to_end(cache_key)
+            self.logger.info("Detected intent (cached): %s (replying_to_image=%s)", cached.intent, is_replying_to_bot_image)
+            return cached
+        self._intent_misses += 1
+        lookups = self._intent_hits + self._intent_misses
+        if lookups % 256 == 0:
+            self.logger.info("Intent cache hit rate: %.1f%% over %d lookups", 100 * self._intent_hits / lookups, lookups)
+
+        # Coalesce concurrent identical classifications onto one task
+        inflight = self._inflight.get(cache_key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._classify(cache_key, provider, preferred_model, api_key, user_message, is_replying_to_bot_image))
+            self._inflight[cache_key] = inflight
+            inflight.add_done_callback(lambda _task: self._inflight.pop(cache_key, None))
+        return await inflight
+
+    async def _classify(self, cache_key: tuple, provider: str, model: str, api_key: str, user_message: str, is_replying_to_bot_image: bool) -> UserIntent:
         # Build gateway request
         req = NormalizedRequest(
             provider=provider,
-            model=preferred_model,
+            model=model,
             messages=[
-                Message(role="system", parts=[MessagePart(type="text", text=system_prompt)]),
+                Message(role="system", parts=[MessagePart(type="text", text=_INTENT_SYSTEM_PROMPT)]),
+                *([Message(role="system", parts=[MessagePart(type="text", text=_IMAGE_REPLY_NOTE)])] if is_replying_to_bot_image else []),
                 Message(role="user", parts=[MessagePart(type="text", text=user_message)]),
             ],
-            response_format=response_format,
+            response_format=_USER_INTENT_RESPONSE_FORMAT,
         )
 
         try:
@@ -73,9 +135,15 @@ Everything else is chat.{context_note}"""
             content = "".join(part.content for part in response.parts if part.type == "text")
             intent = UserIntent.model_validate_json(content)
 
-            self.logger.info(f"Detected intent: {intent.intent} (replying_to_image={is_replying_to_bot_image})")
+            self._intent_cache[cache_key] = intent
+            while len(self._intent_cache) > _INTENT_CACHE_SIZE:
+                self._intent_cache.popitem(last=False)
+
+            self.logger.info("Detected intent: %s (replying_to_image=%s)", intent.intent, is_replying_to_bot_image)
             return intent
 
         except Exception as e:
+            # Fallback results are never cached, so a transient provider
+            # error can't poison future lookups for the same message
             self.logger.error(f"Error detecting intent: {e}")
             return UserIntent(intent="chat", reasoning="Fallback due to error in intent detection")
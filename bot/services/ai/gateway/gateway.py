@@ -1,4 +1,5 @@
 import asyncio
+import threading
 from collections.abc import AsyncIterator
 
 from bot.services.ai.gateway.exceptions import ProviderAuthError, ProviderNotFoundError
@@ -120,10 +121,15 @@ class MeshGateway:
 
 
 _gateway_instance = None
+_gateway_lock = threading.Lock()
 
 
 def get_mesh_gateway() -> MeshGateway:
     global _gateway_instance
+    # Double-checked so callers off the event loop (player threads,
+    # executors) can't race the first construction into two registries
     if _gateway_instance is None:
-        _gateway_instance = MeshGateway()
+        with _gateway_lock:
+            if _gateway_instance is None:
+                _gateway_instance = MeshGateway()
     return _gateway_instance
@@ -13,6 +13,11 @@ from bot.services.ai.gateway.utils import parse_data_url
 
 _cached_models_by_endpoint: dict[str, list[ModelInfo]] = {}
 
+# One AsyncOpenAI per endpoint; constructing it per request threw away the
+# underlying httpx connection pool, paying TCP (and TLS for remote Ollama)
+# setup on every call
+_clients_by_endpoint: dict[str, AsyncOpenAI] = {}
+
 
 class OllamaAdapter(ProviderAdapter):
     # Normalized -> OpenAI format
@@ -161,6 +166,7 @@ class OllamaAdapter(ProviderAdapter):
                     usage={
                         "input_tokens": chunk.usage.prompt_tokens,
                         "output_tokens": chunk.usage.completion_tokens,
+                        "model": chunk.model,
                     },
                 )
             return None
@@ -231,7 +237,12 @@ class OllamaAdapter(ProviderAdapter):
                 base_url = "http://" + base_url
             if not base_url.endswith("/v1") and not base_url.endswith("/v1/"):
                 base_url = base_url.rstrip("/") + "/v1"
-        return AsyncOpenAI(api_key="ollama", base_url=base_url)
+
+        client = _clients_by_endpoint.get(base_url)
+        if client is None:
+            client = AsyncOpenAI(api_key="ollama", base_url=base_url)
+            _clients_by_endpoint[base_url] = client
+        return client
 
     # Public Interfaces
     async def stream(self, request: NormalizedRequest, api_key: str) -> AsyncIterator[StreamChunk]:
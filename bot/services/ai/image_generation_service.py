@@ -1,4 +1,8 @@
+import asyncio
+import base64
+import hashlib
 import logging
+from collections import OrderedDict
 from io import BytesIO
 from typing import TYPE_CHECKING
 
@@ -7,6 +11,7 @@ from PIL import Image
 
 from bot.services.ai.gateway.gateway import get_mesh_gateway
 from bot.services.ai.gateway.schemas.request import Message, MessagePart, NormalizedRequest
+from bot.services.ai.gateway.utils import parse_data_url
 
 from .types import ImageGenerationResponse
 
@@ -15,6 +20,29 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Content-hash LRU caches for boosted prompts and image descriptions, keyed
+# on (provider, model, digest) so a model switch never serves stale text.
+# Retries and iterative edit flows resend identical inputs, so hits skip a
+# full model round trip. Same OrderedDict discipline as the intent cache in
+# AiOrchestrator
+_RESULT_CACHE_SIZE = 2048
+_boost_cache: OrderedDict[tuple, str] = OrderedDict()
+_describe_cache: OrderedDict[tuple, str] = OrderedDict()
+
+
+def _cache_get(cache: OrderedDict, key: tuple) -> str | None:
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache: OrderedDict, key: tuple, value: str) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > _RESULT_CACHE_SIZE:
+        cache.popitem(last=False)
+
 
 class ImageGenerationService:
     """Service for generating and editing images using Gemini AI."""
@@ -22,6 +50,19 @@ class ImageGenerationService:
     def __init__(self, bot: "BruhBot"):
         self.bot = bot
         self.base_prompt = "You must generate an image with the following user prompt. Do not ask follow questions to get the user to refine the prompt."
+        self._http: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """One session for the service lifetime; a fresh session per download
+        repeated the TCP/TLS handshake for every URL."""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=300))
+        return self._http
+
+    async def close(self):
+        """Close the shared HTTP session on bot shutdown."""
+        if self._http and not self._http.closed:
+            await self._http.close()
 
     def _build_generation_context(self, messages: list[Message], prompt: str) -> list[Message]:
         """Keep branch context while replacing the final request with the image-ready prompt."""
@@ -35,7 +76,7 @@ class ImageGenerationService:
 
         return context_messages
 
-    async def boost_prompt(self, guild_id: int, user_prompt: str, image_description: str | None = None) -> str:
+    async def boost_prompt(self, guild_id: int, user_prompt: str, image_description: str | None = None, ai_config=None) -> str:
         try:
             logger.info(f"Boosting prompt: {user_prompt}")
 
@@ -54,12 +95,21 @@ Please enhance this edit request with specific details while maintaining the con
             else:
                 user_content = f"User prompt: {user_prompt}\n\nPlease enhance this prompt with specific details for image generation."
 
-            config = (await self.bot.config_service.get_config(str(guild_id))).aiConfig
+            # Callers that already hold the guild's aiConfig pass it through
+            # instead of re-fetching per hop in the edit/describe/boost chain
+            config = ai_config or (await self.bot.config_service.get_config(str(guild_id))).aiConfig
             provider = config.preferredAiProvider
             provider_config = getattr(config, provider, None) or config.openrouter
             api_key = provider_config.get_api_key()
             preferred_model = provider_config.preferredModel
 
+            digest = hashlib.blake2b(f"{user_prompt}\x00{image_description or ''}".encode(), digest_size=16).digest()
+            cache_key = (provider, preferred_model, digest)
+            cached = _cache_get(_boost_cache, cache_key)
+            if cached is not None:
+                logger.info(f"Boosted prompt (cached): {cached}")
+                return cached
+
             # Construct gateway request
             req = NormalizedRequest(
                 provider=provider,
@@ -74,6 +124,7 @@ Please enhance this edit request with specific details while maintaining the con
             response = await gateway.complete(req, credentials={"api_key": api_key})
             boosted_prompt = "".join(part.content for part in response.parts if part.type == "text").strip()
 
+            _cache_put(_boost_cache, cache_key, boosted_prompt)
             logger.info(f"Boosted prompt: {boosted_prompt}")
             return boosted_prompt
 
@@ -81,27 +132,43 @@ Please enhance this edit request with specific details while maintaining the con
             logger.error(f"Error boosting prompt: {e}", exc_info=True)
             return user_prompt
 
-    async def describe_image(self, guild_id: int, image: Image.Image) -> str:
+    async def describe_image(self, guild_id: int, image: Image.Image, ai_config=None) -> str:
         try:
             logger.info("Generating image description")
 
+            # JPEG is ~5-10x smaller than PNG for photos and this payload is
+            # only read by the vision model, so keep PNG solely for alpha
             buffered = BytesIO()
-            image.save(buffered, format="PNG")
-            import base64
+            has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+            if has_alpha:
+                image.save(buffered, format="PNG")
+                mime = "image/png"
+            else:
+                jpeg_image = image if image.mode in ("RGB", "L") else image.convert("RGB")
+                jpeg_image.save(buffered, format="JPEG", quality=85)
+                mime = "image/jpeg"
+            config = ai_config or (await self.bot.config_service.get_config(str(guild_id))).aiConfig
+            provider = config.preferredAiProvider
+            provider_config = getattr(config, provider, None) or config.openrouter
+            api_key = provider_config.get_api_key()
+            preferred_model = provider_config.preferredModel
+
+            digest = hashlib.blake2b(buffered.getbuffer(), digest_size=16).digest()
+            cache_key = (provider, preferred_model, digest)
+            cached = _cache_get(_describe_cache, cache_key)
+            if cached is not None:
+                logger.info(f"Generated description (cached): {cached[:100]}...")
+                return cached
 
-            img_str = base64.b64encode(buffered.getvalue()).decode()
-            data_url = f"data:image/png;base64,{img_str}"
+            # getbuffer() hands b64encode a view of the bytes instead of
+            # copying them out first
+            img_str = base64.b64encode(buffered.getbuffer()).decode("ascii")
+            data_url = f"data:{mime};base64,{img_str}"
 
             system_prompt = """You are an image analysis expert. Describe the image in detail,
 including composition, subjects, colors, lighting, mood, style, and any notable elements.
 Be specific and thorough as this description will be used for image editing context."""
 
-            config = (await self.bot.config_service.get_config(str(guild_id))).aiConfig
-            provider = config.preferredAiProvider
-            provider_config = getattr(config, provider, None) or config.openrouter
-            api_key = provider_config.get_api_key()
-            preferred_model = provider_config.preferredModel
-
             # Construct gateway request with system prompt and user message containing image
             req = NormalizedRequest(
                 provider=provider,
@@ -116,6 +183,7 @@ Be specific and thorough as this description will be used for image editing cont
             response = await gateway.complete(req, credentials={"api_key": api_key})
             description = "".join(part.content for part in response.parts if part.type == "text").strip()
 
+            _cache_put(_describe_cache, cache_key, description)
             logger.info(f"Generated description: {description[:100]}...")
             return description
 
@@ -126,16 +194,15 @@ Be specific and thorough as this description will be used for image editing cont
     async def download_image_from_url(self, url: str) -> Image.Image | None:
         try:
             logger.info(f"Downloading image from: {url}")
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as resp:
-                    if resp.status == 200:
-                        image_data = await resp.read()
-                        image = Image.open(BytesIO(image_data))
-                        logger.info("Image downloaded successfully")
-                        return image
-                    else:
-                        logger.error(f"Failed to download image: HTTP {resp.status}")
-                        return None
+            async with self._get_session().get(url) as resp:
+                if resp.status == 200:
+                    image_data = await resp.read()
+                    image = Image.open(BytesIO(image_data))
+                    logger.info("Image downloaded successfully")
+                    return image
+                else:
+                    logger.error(f"Failed to download image: HTTP {resp.status}")
+                    return None
         except Exception as e:
             logger.error(f"Error downloading image: {e}", exc_info=True)
             return None
@@ -146,7 +213,7 @@ Be specific and thorough as this description will be used for image editing cont
 
             boosted_prompt = prompt
             if config.imageGeneration.boostImagePrompts:
-                boosted_prompt = await self.boost_prompt(guild_id, prompt)
+                boosted_prompt = await self.boost_prompt(guild_id, prompt, ai_config=config)
 
             logger.info(f"Generating image with {'boosted ' if config.imageGeneration.boostImagePrompts else ''}prompt: {boosted_prompt}")
             logger.info(f"Using OpenRouter for image generation with model {config.imageGeneration.preferredModel}")
@@ -188,16 +255,16 @@ Be specific and thorough as this description will be used for image editing cont
                 img_url = image_part.content
                 if img_url.startswith("data:image"):
                     try:
-                        import base64
-
-                        from bot.services.ai.gateway.utils import parse_data_url
-
                         parsed = parse_data_url(img_url)
                         if parsed:
-                            _, b64_data = parsed
+                            mime, b64_data = parsed
                             image_data = base64.b64decode(b64_data)
-                            image = Image.open(BytesIO(image_data))
-                            image_generation_response.generated_image = image
+                            if mime == "image/png":
+                                # Already PNG; pass the bytes straight through
+                                # instead of a PIL decode/re-encode round trip
+                                image_generation_response.raw_bytes = image_data
+                            else:
+                                image_generation_response.generated_image = Image.open(BytesIO(image_data))
                             logger.info("Image generated successfully from base64")
                     except Exception as e:
                         logger.error(f"Error decoding base64 generated image: {e}")
@@ -224,13 +291,13 @@ Be specific and thorough as this description will be used for image editing cont
             config = (await self.bot.config_service.get_config(str(guild_id))).aiConfig
 
             if config.boostImagePrompts and source_images:
-                descriptions = []
-                for idx, img in enumerate(source_images, 1):
-                    desc = await self.describe_image(guild_id, img)
-                    descriptions.append(f"Image {idx}: {desc}")
+                # Descriptions are independent of each other; run them
+                # concurrently instead of one round trip per image
+                descs = await asyncio.gather(*(self.describe_image(guild_id, img, ai_config=config) for img in source_images))
+                descriptions = [f"Image {idx}: {desc}" for idx, desc in enumerate(descs, 1)]
 
                 combined_description = "\n\n".join(descriptions)
-                boosted_prompt = await self.boost_prompt(guild_id, prompt, combined_description)
+                boosted_prompt = await self.boost_prompt(guild_id, prompt, combined_description, ai_config=config)
                 logger.info(f"Editing {len(source_images)} image(s) with boosted prompt: {boosted_prompt}")
             else:
                 boosted_prompt = prompt
@@ -241,9 +308,7 @@ Be specific and thorough as this description will be used for image editing cont
             for img in source_images:
                 buffered = BytesIO()
                 img.save(buffered, format="PNG")
-                import base64
-
-                img_str = base64.b64encode(buffered.getvalue()).decode()
+                img_str = base64.b64encode(buffered.getbuffer()).decode("ascii")
                 data_url = f"data:image/png;base64,{img_str}"
                 parts.append(MessagePart(type="image", url=data_url))
 
@@ -283,16 +348,14 @@ Be specific and thorough as this description will be used for image editing cont
                 img_url = image_part.content
                 if img_url.startswith("data:image"):
                     try:
-                        import base64
-
-                        from bot.services.ai.gateway.utils import parse_data_url
-
                         parsed = parse_data_url(img_url)
                         if parsed:
-                            _, b64_data = parsed
+                            mime, b64_data = parsed
                             image_data = base64.b64decode(b64_data)
-                            image = Image.open(BytesIO(image_data))
-                            image_generation_response.generated_image = image
+                            if mime == "image/png":
+                                image_generation_response.raw_bytes = image_data
+                            else:
+                                image_generation_response.generated_image = Image.open(BytesIO(image_data))
                             logger.info("Image edited successfully from base64")
                     except Exception as e:
                         logger.error(f"Error decoding base64 edited image: {e}")
@@ -313,12 +376,16 @@ Be specific and thorough as this description will be used for image editing cont
             return None
 
     async def download_images_from_urls(self, urls: list[str]) -> list[Image.Image]:
-        images = []
-        for url in urls:
-            image = await self.download_image_from_url(url)
-            if image:
-                images.append(image)
-        return images
+        # Downloads are independent; fetch them concurrently, capped so a
+        # huge URL batch can't open unbounded connections
+        sem = asyncio.Semaphore(8)
+
+        async def _one(url: str) -> Image.Image | None:
+            async with sem:
+                return await self.download_image_from_url(url)
+
+        results = await asyncio.gather(*(_one(url) for url in urls))
+        return [image for image in results if image]
 
     async def edit_image_from_url(self, guild_id: int, prompt: str, image_url: str, messages: list[Message], user_id: int = 0) -> ImageGenerationResponse | None:
         source_image = await self.download_image_from_url(image_url)
@@ -338,7 +405,12 @@ Be specific and thorough as this description will be used for image editing cont
 
     def image_to_bytes(self, image: Image.Image, format: str = "PNG") -> BytesIO:
         output = BytesIO()
-        image.save(output, format=format)
+        if format == "PNG":
+            # Light compression: upload bandwidth dominates, so trade a
+            # slightly larger file for much less CPU per generated image
+            image.save(output, format=format, compress_level=1)
+        else:
+            image.save(output, format=format)
         output.seek(0)
         return output
 
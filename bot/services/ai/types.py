@@ -17,3 +17,6 @@ class UserIntent(BaseModel):
 class ImageGenerationResponse:
     text_response: str = "Here is your generated image"
     generated_image: PILImage | None = None
+    # Encoded image exactly as the provider returned it; set when the bytes
+    # can be sent to Discord as-is, skipping the PIL decode/re-encode
+    raw_bytes: bytes | None = None
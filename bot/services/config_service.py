@@ -1,13 +1,16 @@
 import asyncio
+import functools
 import logging
 import os
 from datetime import UTC, datetime
 from typing import Any, Literal
 
+import orjson
 import yaml
 from cryptography.fernet import Fernet
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from pydantic import BaseModel, Field, SecretStr, model_validator
+from pymongo import ReturnDocument
 
 logger = logging.getLogger("bot.config")
 
@@ -55,22 +58,42 @@ class AIUsageLimitConfig(BaseModel):
     maxRequestsPerHour: int = 50
 
 
+# Parsed prompts keyed by path -> (st_mtime_ns, result). Steady-state model
+# construction pays one stat() instead of a read+parse, while edits to
+# prompts.json are still picked up without a restart.
+_prompts_cache: dict[str, tuple[int, tuple[str, str]]] = {}
+
+
 def load_default_prompts() -> tuple[str, str]:
-    """Helper to load system prompts from local prompts.json if available as initial seed."""
+    """Helper to load system prompts from local prompts.json if available as initial seed.
+
+    Cached on the file's mtime: the default_factory fields below call this
+    for every config model constructed, which used to mean a file read and
+    JSON parse each time. orjson parses the raw bytes without a text-decode
+    intermediate.
+    """
+    path = os.path.join(os.getcwd(), "config/prompts.json")
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return "", ""
+
+    cached = _prompts_cache.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
     system_prompt = ""
     realtime_prompt = ""
     try:
-        import json
-
-        path = os.path.join(os.getcwd(), "config/prompts.json")
-        if os.path.exists(path):
-            with open(path) as f:
-                prompts = json.load(f)
-                system_prompt = prompts.get("main", "")
-                realtime_prompt = prompts.get("realtime", "")
+        with open(path, "rb") as f:
+            prompts = orjson.loads(f.read())
+            system_prompt = prompts.get("main", "")
+            realtime_prompt = prompts.get("realtime", "")
     except Exception:
         pass
-    return system_prompt, realtime_prompt
+    result = (system_prompt, realtime_prompt)
+    _prompts_cache[path] = (mtime_ns, result)
+    return result
 
 
 class AIConfig(BaseModel):
@@ -223,6 +246,25 @@ class DynamicConfig(BaseModel):
     economyConfig: EconomyConfig = Field(default_factory=EconomyConfig)
     reputationConfig: ReputationConfig = Field(default_factory=ReputationConfig)
 
+    # Set views over the membership lists for O(1) lookups on hot paths like
+    # on_message. cached_property ties their lifetime to the model instance,
+    # which is rebuilt whenever the config changes.
+    @functools.cached_property
+    def allowedBotsSet(self) -> frozenset[str]:
+        return frozenset(self.allowedBotsToRespondTo)
+
+    @functools.cached_property
+    def globalBlockSet(self) -> frozenset[str]:
+        return frozenset(self.globalBlockList)
+
+    @functools.cached_property
+    def adminIdsSet(self) -> frozenset[str]:
+        return frozenset(self.adminIds)
+
+    @functools.cached_property
+    def cooldownBypassSet(self) -> frozenset[str]:
+        return frozenset(self.cooldownBypassList)
+
 
 class ConfigService:
     ENCRYPTED_PROVIDERS = [
@@ -246,14 +288,32 @@ class ConfigService:
         self._version: int = 0
         self._watch_task: asyncio.Task | None = None
         self.environment: str | None = None
+        self._initialized: bool = False
+        self._init_lock = asyncio.Lock()
+        # Serializes reloads: the watcher and the /config/reload endpoint can
+        # both call reload_if_changed concurrently
+        self._reload_lock = asyncio.Lock()
+        self.api_admin_key_bytes: bytes = b""
 
     async def initialize(self, environment: str):
-        """Load config from YAML."""
+        """Load config from YAML. Idempotent and safe under concurrent callers."""
+        if self._initialized:
+            return
+
+        async with self._init_lock:
+            if self._initialized:
+                return
+            await self._initialize(environment)
+            self._initialized = True
+
+    async def _initialize(self, environment: str):
         self.environment = environment
         self.base = self._load_yaml(environment)
         self.cipher = Fernet(self.base.encryptionKey.encode())
+        # Precomputed for constant-time comparison on every API request
+        self.api_admin_key_bytes = self.api_admin_key.encode()
 
-        self.client = AsyncIOMotorClient(self.base.mongoUri)
+        self.client = AsyncIOMotorClient(self.base.mongoUri, minPoolSize=5, maxPoolSize=10)
         self.db = self.client[self.base.mongoDbName]
         logger.info(f"Connected to MongoDB: {self.base.mongoDbName} (env={self.environment})")
 
@@ -261,6 +321,10 @@ class ConfigService:
 
         logger.info(f"Config initialized: env={self.environment.upper()}")
 
+    async def ping(self):
+        """Round-trip to MongoDB, establishing pool connections eagerly."""
+        await self.client.admin.command("ping")
+
     def col(self, base_name: str):
         """Get a MongoDB collection reference with per-environment namespacing.
 
@@ -293,9 +357,27 @@ class ConfigService:
         return BaseConfig(**data)
 
     async def get_config(self, guild_id: str) -> DynamicConfig:
-        if guild_id not in self._configs:
+        config = self._configs.get(guild_id)
+        if config is None:
             await self._load_from_mongo(guild_id)
-        return self._configs[guild_id]
+            config = self._configs[guild_id]
+        return config
+
+    def get_cached_config(self, guild_id: str) -> DynamicConfig | None:
+        """Synchronous fast path: the already-parsed config, or None if not loaded yet.
+
+        Hot paths that run after a guild's config has been loaded can use this
+        to skip the coroutine round trip of get_config entirely.
+        """
+        return self._configs.get(guild_id)
+
+    def invalidate(self, guild_id: str):
+        """Drop the cached config (and derived services) for a guild.
+
+        The next get_config call reloads from MongoDB.
+        """
+        self._configs.pop(guild_id, None)
+        self._services.pop(guild_id, None)
 
     async def _load_from_mongo(self, guild_id: str):
         """Load dynamic config from MongoDB."""
@@ -377,17 +459,18 @@ class ConfigService:
         if not self._configs:
             return
 
-        coll = self.col(self.base.mongoConfigCollectionName)
-        cursor = coll.find({"guildId": {"$in": list(self._configs.keys())}}, {"configVersion": 1, "guildId": 1})
+        async with self._reload_lock:
+            coll = self.col(self.base.mongoConfigCollectionName)
+            cursor = coll.find({"guildId": {"$in": list(self._configs.keys())}}, {"configVersion": 1, "guildId": 1})
 
-        async for doc in cursor:
-            gid = doc["guildId"]
-            if doc.get("configVersion", 0) > self._configs[gid].configVersion:
-                logger.info(f"Reloading guild {gid} due to version mismatch")
-                await self._load_from_mongo(gid)
-                # Clear services for this guild so they get recreated with new config
-                if gid in self._services:
-                    del self._services[gid]
+            async for doc in cursor:
+                gid = doc["guildId"]
+                if doc.get("configVersion", 0) > self._configs[gid].configVersion:
+                    logger.info(f"Reloading guild {gid} due to version mismatch")
+                    await self._load_from_mongo(gid)
+                    # Clear services for this guild so they get recreated with new config
+                    if gid in self._services:
+                        del self._services[gid]
 
     async def start_watcher(self, interval: int = 10):
         async def watch():
@@ -410,16 +493,87 @@ class ConfigService:
                 pass
             logger.info("Watcher stopped")
 
-    async def update(self, guild_id: str, updates: dict):
-        """Update dynamic config for a specific guild."""
+    async def update(self, guild_id: str, updates: dict) -> DynamicConfig:
+        """Update dynamic config for a specific guild and return the updated model."""
         config = await self.get_config(guild_id)
         data = config.model_dump()
         data.update(updates)
-        self._configs[guild_id] = DynamicConfig(**data)
+        updated = DynamicConfig(**data)
+        self._configs[guild_id] = updated
         await self.save(guild_id)
         # Clear services for this guild so they get recreated with new config
-        if guild_id in self._services:
-            del self._services[guild_id]
+        self._services.pop(guild_id, None)
+        return updated
+
+    async def update_nested(self, guild_id: str, updates: dict) -> DynamicConfig:
+        """Deep-merge a partial update into a guild's config and return the new model.
+
+        Unlike update, nested dicts are merged key-by-key, so callers only send
+        the fields that actually changed instead of dumping and rewriting whole
+        subtrees like aiConfig. The write itself stays replace-based because
+        API keys are encrypted client-side before the document hits MongoDB.
+        """
+        config = await self.get_config(guild_id)
+        data = config.model_dump()
+        self._deep_merge(data, updates)
+        updated = DynamicConfig(**data)
+        self._configs[guild_id] = updated
+        await self.save(guild_id)
+        self._services.pop(guild_id, None)
+        return updated
+
+    async def add_admin_id(self, guild_id: str, user_id: str) -> DynamicConfig | None:
+        """Atomically add an admin ID via $addToSet in a single round trip.
+
+        Returns the updated config, or None if the user is already an admin.
+        """
+        config = await self.get_config(guild_id)
+        if user_id in config.adminIds:
+            return None
+
+        coll = self.col(self.base.mongoConfigCollectionName)
+        doc = await coll.find_one_and_update(
+            {"guildId": guild_id},
+            {"$addToSet": {"adminIds": user_id}, "$inc": {"configVersion": 1}, "$set": {"lastUpdated": datetime.now(UTC)}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if doc is None:
+            # Guild has no persisted document yet; fall back to a full save
+            return await self.update(guild_id, {"adminIds": [*config.adminIds, user_id]})
+        return self._refresh_from_doc(guild_id, doc)
+
+    async def remove_admin_id(self, guild_id: str, user_id: str) -> DynamicConfig | None:
+        """Atomically remove an admin ID via $pull in a single round trip.
+
+        The filter requires at least two admins, so the last admin can never
+        be removed even under concurrent requests. Returns None if nothing
+        matched (user not an admin, or they are the last one).
+        """
+        coll = self.col(self.base.mongoConfigCollectionName)
+        doc = await coll.find_one_and_update(
+            {"guildId": guild_id, "adminIds": user_id, "adminIds.1": {"$exists": True}},
+            {"$pull": {"adminIds": user_id}, "$inc": {"configVersion": 1}, "$set": {"lastUpdated": datetime.now(UTC)}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if doc is None:
+            return None
+        return self._refresh_from_doc(guild_id, doc)
+
+    def _refresh_from_doc(self, guild_id: str, doc: dict) -> DynamicConfig:
+        """Rebuild the cached model from a document Mongo just returned."""
+        self._decrypt(doc)
+        config = DynamicConfig.model_validate(doc)
+        self._configs[guild_id] = config
+        self._services.pop(guild_id, None)
+        return config
+
+    @staticmethod
+    def _deep_merge(base: dict, updates: dict):
+        for key, value in updates.items():
+            if isinstance(value, dict) and isinstance(base.get(key), dict):
+                ConfigService._deep_merge(base[key], value)
+            else:
+                base[key] = value
 
     def _validate(self, guild_id: str):
         """Validate config for a specific guild."""
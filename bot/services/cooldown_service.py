@@ -1,8 +1,9 @@
 import logging
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
 from bson import Int64
+from pymongo.errors import DuplicateKeyError
 
 if TYPE_CHECKING:
     from bot.bruh_bot import BruhBot
@@ -30,36 +31,34 @@ class CooldownService:
         except Exception as e:
             self.logger.warning(f"Could not create indexes for {self.collection_name}: {e}")
 
-    async def check_cooldown(self, user_id: int, guild_id: int, username: str) -> bool:
-        """Check if user is on cooldown. Returns True if can proceed."""
+    async def check_and_bump(self, user_id: int, guild_id: int, username: str) -> bool:
+        """Check the cooldown and claim the interaction slot in one round trip.
+
+        Returns True if the user may proceed; their last-interaction time is
+        updated atomically as part of the same query, replacing the old
+        find_one + update_one pair.
+        """
         config = await self.bot.config_service.get_config(str(guild_id))
 
-        if str(user_id) in config.cooldownBypassList:
+        if str(user_id) in config.cooldownBypassSet:
             return True
 
-        user_data = await self.collection.find_one({"guild_id": Int64(guild_id), "user_id": Int64(user_id)})
+        now = datetime.now(UTC)
+        cutoff = now - timedelta(seconds=config.mentionCooldown)
 
-        if not user_data:
+        try:
+            await self.collection.find_one_and_update(
+                {
+                    "guild_id": Int64(guild_id),
+                    "user_id": Int64(user_id),
+                    "last_interaction": {"$lt": cutoff},
+                },
+                {"$set": {"last_interaction": now}},
+                upsert=True,
+            )
             return True
-
-        last_interaction = user_data["last_interaction"]
-        if last_interaction.tzinfo is None:
-            last_interaction = last_interaction.replace(tzinfo=UTC)
-
-        current_time = datetime.now(UTC)
-        time_since_last = (current_time - last_interaction).total_seconds()
-
-        if time_since_last < config.mentionCooldown:
-            remaining_time = int(config.mentionCooldown - time_since_last)
-            self.logger.info(f"⏰ Slow down! {username} is on cooldown for {remaining_time}s in guild {guild_id}.")
+        except DuplicateKeyError:
+            # The doc exists but last_interaction is within the window, so
+            # the filter missed and the upsert collided: still on cooldown
+            self.logger.info(f"⏰ Slow down! {username} is on cooldown in guild {guild_id}.")
             return False
-
-        return True
-
-    async def update_cooldown(self, user_id: int, guild_id: int):
-        """Update the last interaction time for a user in MongoDB."""
-        await self.collection.update_one(
-            {"guild_id": Int64(guild_id), "user_id": Int64(user_id)},
-            {"$set": {"last_interaction": datetime.now(UTC)}},
-            upsert=True,
-        )
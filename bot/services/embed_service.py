@@ -1,3 +1,4 @@
+import io
 import logging
 import os
 from datetime import datetime
@@ -10,6 +11,25 @@ from .music.types import AudioMetaData, AudioSource
 STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "static")
 
 
+def _load_static_assets() -> dict[str, bytes]:
+    """Read the brand assets into memory once; they never change at runtime.
+
+    Every embed send used to re-list STATIC_DIR and re-open the attachment
+    files from disk - one or more filesystem reads per message.
+    """
+    assets: dict[str, bytes] = {}
+    if os.path.isdir(STATIC_DIR):
+        for filename in os.listdir(STATIC_DIR):
+            path = os.path.join(STATIC_DIR, filename)
+            if os.path.isfile(path):
+                with open(path, "rb") as f:
+                    assets[filename] = f.read()
+    return assets
+
+
+_STATIC_ASSETS = _load_static_assets()
+
+
 class BrandColor(Enum):
     PRIMARY = 0x5865F2
     ACCENT = 0x00B0F4
@@ -19,8 +39,13 @@ class BrandColor(Enum):
 
 
 def _asset_url(filename: str) -> str | None:
-    path = os.path.join(STATIC_DIR, filename)
-    return f"attachment://{filename}" if os.path.exists(path) else None
+    return f"attachment://{filename}" if filename in _STATIC_ASSETS else None
+
+
+# Fixed attachment URLs used by every branded embed; fold them once
+_AVATAR_URL = _asset_url("avatar.png")
+_SUCCESS_ICON_URL = _asset_url("success.png")
+_ERROR_ICON_URL = _asset_url("error.png")
 
 
 class EmbedService:
@@ -40,16 +65,17 @@ class EmbedService:
             timestamp=datetime.now(),
         )
         embed.set_footer(text="bruh.bot")
-        avatar_url = _asset_url("avatar.png")
-        if avatar_url:
-            embed.set_author(name="bruh.bot", icon_url=avatar_url)
+        if _AVATAR_URL:
+            embed.set_author(name="bruh.bot", icon_url=_AVATAR_URL)
         return embed
 
     @staticmethod
     def get_brand_files(embed: discord.Embed | None = None) -> list[discord.File]:
-        if not os.path.isdir(STATIC_DIR):
+        if not _STATIC_ASSETS:
             return []
 
+        # discord.File objects are single-use, so build fresh ones per send -
+        # but from the cached bytes, not the filesystem
         if embed is not None:
             needed = set()
             raw = embed.to_dict()
@@ -63,9 +89,9 @@ class EmbedService:
                     needed.add(url.replace("attachment://", ""))
             if not needed:
                 return []
-            return [discord.File(os.path.join(STATIC_DIR, f), filename=f) for f in os.listdir(STATIC_DIR) if f in needed and os.path.isfile(os.path.join(STATIC_DIR, f))]
+            return [discord.File(io.BytesIO(data), filename=f) for f, data in _STATIC_ASSETS.items() if f in needed]
 
-        return [discord.File(os.path.join(STATIC_DIR, f), filename=f) for f in os.listdir(STATIC_DIR) if os.path.isfile(os.path.join(STATIC_DIR, f)) and f.lower().endswith((".png", ".jpg", ".jpeg", ".gif", ".webp"))]
+        return [discord.File(io.BytesIO(data), filename=f) for f, data in _STATIC_ASSETS.items() if f.lower().endswith((".png", ".jpg", ".jpeg", ".gif", ".webp"))]
 
     def create_action_embed(
         self,
@@ -80,13 +106,10 @@ class EmbedService:
         if thumbnail_url:
             embed.set_thumbnail(url=thumbnail_url)
         elif is_success:
-            icon = _asset_url("success.png")
-            if icon:
-                embed.set_thumbnail(url=icon)
-        else:
-            icon = _asset_url("error.png")
-            if icon:
-                embed.set_thumbnail(url=icon)
+            if _SUCCESS_ICON_URL:
+                embed.set_thumbnail(url=_SUCCESS_ICON_URL)
+        elif _ERROR_ICON_URL:
+            embed.set_thumbnail(url=_ERROR_ICON_URL)
 
         return embed
 
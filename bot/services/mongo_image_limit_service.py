@@ -89,6 +89,54 @@ class MongoImageLimitService:
 
         return True, ""
 
+    async def reserve_slot(self, message: discord.Message) -> tuple[bool, str]:
+        """Atomically check-and-consume one image slot.
+
+        The common case is a single find_one_and_update that only matches
+        while count < max_daily_images, replacing the separate
+        can_generate_image + increment_usage pair and closing the race where
+        two concurrent requests both pass the check. Documents that are
+        missing or whose window has rolled over fall back to the full
+        can_generate_image path. Callers must refund_slot() if generation
+        fails after a successful reservation.
+        """
+        now = datetime.now(self.timezone)
+        doc = await self.collection.find_one_and_update(
+            {
+                "guild_id": Int64(message.guild.id),
+                "user_id": Int64(message.author.id),
+                # Only fast-path documents whose window is still open; a
+                # rolled-over doc must take the reset path below so yesterday's
+                # count never leaks into today's quota
+                "reset_time": {"$gt": now},
+                "$expr": {"$lt": ["$count", "$max_daily_images"]},
+            },
+            {"$inc": {"count": 1}},
+        )
+        if doc is not None:
+            return True, ""
+
+        # No matching doc: either it doesn't exist, the window has rolled
+        # over, or the limit is genuinely reached - let the existing logic
+        # sort that out (it also builds the user-facing message)
+        can_generate, limit_message = await self.can_generate_image(message)
+        if not can_generate:
+            return False, limit_message
+
+        await self.collection.update_one(
+            {"guild_id": Int64(message.guild.id), "user_id": Int64(message.author.id)},
+            {"$inc": {"count": 1}},
+        )
+        return True, ""
+
+    async def refund_slot(self, user_id: int, guild_id: int):
+        """Give back a reserved slot after a failed generation."""
+        await self.collection.update_one(
+            {"guild_id": Int64(guild_id), "user_id": Int64(user_id), "count": {"$gt": 0}},
+            {"$inc": {"count": -1}},
+        )
+        self.logger.info(f"Refunded image slot for user {user_id} in guild {guild_id}")
+
     async def increment_usage(self, user_id: int, guild_id: int):
         """Increment the user's daily image count."""
         result = await self.collection.update_one(
@@ -90,7 +90,7 @@ class AudioService:
             }
 
         # Run yt-dlp in a thread to avoid blocking the event loop
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         def _extract():
             with yt_dlp.YoutubeDL(self.YDL_OPTS) as ydl:
@@ -14,10 +14,12 @@ class MusicQueueService:
         self.players: dict[int, MusicPlayer] = {}
 
     def get_player(self, guild: discord.Guild) -> MusicPlayer:
-        if guild.id not in self.players:
+        # Single dict lookup on the hot path; only misses pay for creation
+        player = self.players.get(guild.id)
+        if player is None:
             player = MusicPlayer(self.bot, guild)
             self.players[guild.id] = player
-        return self.players[guild.id]
+        return player
 
     def remove_player(self, guild: discord.Guild):
         if guild.id in self.players:
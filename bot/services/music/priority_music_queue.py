@@ -1,9 +1,42 @@
 import asyncio
+from itertools import islice
+
+
+class QueueView:
+    """Lazy, read-only view over a queue's underlying deque.
+
+    Supports len(), iteration, and slice access without copying the whole
+    queue, so pagination renders O(page) items instead of snapshotting O(n).
+    """
+
+    __slots__ = ("_dq",)
+
+    def __init__(self, dq):
+        self._dq = dq
+
+    def __len__(self) -> int:
+        return len(self._dq)
+
+    def __bool__(self) -> bool:
+        return bool(self._dq)
+
+    def __iter__(self):
+        return iter(self._dq)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._dq))
+            return list(islice(self._dq, start, stop, step))
+        return self._dq[index]
 
 
 class PriorityMusicQueue(asyncio.Queue):
     """Queue with support for adding items to the front"""
 
+    def view(self) -> QueueView:
+        """A lazy read-only view of the queued items (no copy)."""
+        return QueueView(self._queue)
+
     def put_front_nowait(self, item):
         """Put an item at the front of the queue without blocking."""
         if self._is_shutdown:
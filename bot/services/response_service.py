@@ -1,5 +1,7 @@
 import logging
 import re
+import time
+from collections.abc import AsyncIterator, Callable
 from typing import TYPE_CHECKING
 
 import discord
@@ -51,6 +53,57 @@ class ResponseService:
 
         return chunks
 
+    async def stream_response(self, message: discord.Message, deltas: AsyncIterator[str], postprocess: Callable[[str], str] | None = None, reply: bool = True, edit_interval: float = 1.0) -> tuple[discord.Message | None, str]:
+        """Stream an AI response into a single reply, editing it as text arrives.
+
+        The first delta is sent as soon as it lands so the user sees output at
+        time-to-first-token instead of waiting for the full completion. The
+        reply is then edited at most once per edit_interval (Discord's edit
+        bucket allows roughly one edit per second sustained, so going much
+        lower just queues in the rate limiter). Mention processing and long
+        message splitting happen once at the end, mirroring send_response.
+
+        Returns the last sent message and the final (postprocessed) text.
+        """
+        content = ""
+        sent_message = None
+        last_edit = 0.0
+
+        async for delta in deltas:
+            content += delta
+            text = postprocess(content) if postprocess else content
+            if not text.strip():
+                continue
+
+            now = time.monotonic()
+            if sent_message is None:
+                try:
+                    sent_message = await (message.reply(text[:2000]) if reply else message.channel.send(text[:2000]))
+                except Exception:
+                    sent_message = await message.channel.send(text[:2000])
+                last_edit = now
+            elif now - last_edit >= edit_interval and len(text) <= 2000:
+                try:
+                    await sent_message.edit(content=text)
+                    last_edit = now
+                except Exception as e:
+                    self.logger.debug(f"Failed to edit streaming response: {e}")
+
+        final = postprocess(content) if postprocess else content
+        if not final.strip():
+            return sent_message, final
+
+        if sent_message is None:
+            return await self.send_response(message, final, reply=reply), final
+
+        processed_content = await self.process_mentions(message.guild.id, final)
+        chunks = await self.split_long_message(processed_content)
+        await sent_message.edit(content=chunks[0])
+        for chunk in chunks[1:]:
+            await message.channel.send("...")
+            sent_message = await message.channel.send(chunk)
+        return sent_message, final
+
     async def send_response(self, message: discord.Message, content: str, image_file: discord.File | None = None, reply: bool = True, ephemeral: bool = False) -> discord.Message | None:
         """Send the AI response, splitting if necessary."""
         processed_content = await self.process_mentions(message.guild.id, content)
@@ -20,6 +20,9 @@ if TYPE_CHECKING:
 def is_admin() -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
     """
     Decorator that checks if the user is in the ADMINS list from environment variables.
+
+    Each call builds a fresh decorator closure; command modules call this
+    once (`_ADMIN = is_admin()`) and apply the result to every command.
     """
 
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
@@ -41,7 +44,7 @@ def is_admin() -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]
 
             config = await bot.config_service.get_config(str(interaction.guild.id))
 
-            if str(interaction.user.id) in config.adminIds:
+            if str(interaction.user.id) in config.adminIdsSet:
                 return await func(*args, **kwargs)
             else:
                 logger.warning(f"User '{interaction.user.name}' of '{interaction.guild.name}' attempted to run an Admin command.")
@@ -15,6 +15,9 @@ def log_command_usage() -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awa
     """
     Decorator that logs when a slash command is used, who used it, and with what arguments.
     To be used with Discord slash commands in both cogs and standalone functions.
+
+    Each call builds a fresh decorator closure; command modules call this
+    once (`_LOG = log_command_usage()`) and apply the result to every command.
     """
 
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
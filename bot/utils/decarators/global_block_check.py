@@ -20,6 +20,9 @@ if TYPE_CHECKING:
 def is_globally_blocked() -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
     """
     Decorator that checks if the user is in the globalBlock list from environment variables.
+
+    Each call builds a fresh decorator closure; command modules call this
+    once (`_BLOCK = is_globally_blocked()`) and apply the result to every command.
     """
 
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
@@ -39,7 +42,7 @@ def is_globally_blocked() -> Callable[[Callable[P, Awaitable[T]]], Callable[P, A
 
             config = await bot.config_service.get_config(str(interaction.guild.id))
 
-            if str(interaction.user.id) not in config.globalBlockList:
+            if str(interaction.user.id) not in config.globalBlockSet:
                 return await func(*args, **kwargs)
             else:
                 logger.warning(f"User '{interaction.user.name}' of '{interaction.guild.name}' attempted to run an slash command, but is globally blocked.")
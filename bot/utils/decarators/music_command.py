@@ -0,0 +1,78 @@
+import logging
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from typing import TYPE_CHECKING, ParamSpec, TypeVar, cast
+
+import discord
+
+from bot.services.embed_service import EmbedService
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+embed_service = EmbedService()
+
+if TYPE_CHECKING:
+    from bot.bruh_bot import BruhBot
+
+
+def music_command(ephemeral: bool = True, allow_admin_bypass: bool = False) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """
+    Fused guard for music commands: usage logging, voice-channel requirement,
+    and global-block check in a single wrapper frame.
+
+    Equivalent to stacking log_command_usage + require_voice_channel +
+    is_globally_blocked, but runs one coroutine instead of three and fetches
+    the guild config once instead of twice.
+
+    Args:
+        ephemeral (bool, optional): Whether guard responses should be ephemeral. Defaults to True.
+        allow_admin_bypass (bool, optional): Whether admins skip the voice-channel requirement. Defaults to False.
+    """
+
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            # Find the interaction object
+            interaction = next(
+                (arg for arg in args if isinstance(arg, discord.Interaction)),
+                kwargs.get("interaction", None),
+            )
+
+            if not interaction:
+                # If there's no interaction, just call the original function
+                return await func(*args, **kwargs)
+
+            user = f"{interaction.user.name} ({interaction.user.id})"
+            guild = f"{interaction.guild.name} ({interaction.guild.id})" if interaction.guild else "DM"
+            args_str = ", ".join([f"{k}={repr(v)}" for k, v in kwargs.items()])
+            logger.info(f"Command '{func.__name__}' executed by {user} in {guild}{' with args ' + args_str if args_str else ''}")
+
+            bot: BruhBot = interaction.client
+            config = await bot.config_service.get_config(str(interaction.guild.id))
+            user_id = str(interaction.user.id)
+
+            # Voice-channel requirement (admins may bypass)
+            is_admin = allow_admin_bypass and user_id in config.adminIdsSet
+            if not is_admin and not interaction.user.voice:
+                await interaction.response.send_message(
+                    "You're not in a voice channel! Please join a voice channel and try again.",
+                    ephemeral=ephemeral,
+                )
+                return cast(T, None)
+
+            # Global block check
+            if user_id in config.globalBlockSet:
+                logger.warning(f"User '{interaction.user.name}' of '{interaction.guild.name}' attempted to run an slash command, but is globally blocked.")
+                embed = embed_service.create_error_embed(error_message="You don't have permission to use this command.")
+                if not interaction.response.is_done():
+                    await interaction.response.defer(ephemeral=True)
+                await interaction.followup.send(embed=embed, ephemeral=True, files=embed_service.get_brand_files(embed=embed))
+                return cast(T, None)
+
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
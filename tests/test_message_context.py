@@ -332,7 +332,7 @@ class ImageIntentPersistenceTests(unittest.IsolatedAsyncioTestCase):
         bot = SimpleNamespace(
             user=SimpleNamespace(id=999, name="bruh.bot"),
             message_service=context_builder,
-            image_limit_service=SimpleNamespace(can_generate_image=self._can_generate),
+            image_limit_service=SimpleNamespace(reserve_slot=self._reserve_slot, refund_slot=self._refund_slot),
             ai_usage_service=SimpleNamespace(consume_request=self._consume_request),
             image_generation_service=image_service,
             response_service=SimpleNamespace(send_response=self._send_response),
@@ -352,9 +352,12 @@ class ImageIntentPersistenceTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(self.memory_context["content"], "Here is your city.")
         self.assertEqual(self.reputation_context["content"], "Here is your city.")
 
-    async def _can_generate(self, _message):
+    async def _reserve_slot(self, _message):
         return True, ""
 
+    async def _refund_slot(self, _user_id, _guild_id):
+        self.refunded = True
+
     async def _consume_request(self, _user_id, _guild_id):
         return True, ""
 
@@ -367,7 +370,7 @@ class ImageIntentPersistenceTests(unittest.IsolatedAsyncioTestCase):
 
     async def _generate_image(self, **kwargs):
         self.generate_kwargs = kwargs
-        return SimpleNamespace(generated_image=None, text_response="Here is your city.")
+        return SimpleNamespace(generated_image=None, raw_bytes=None, text_response="Here is your city.")
 
     async def _send_response(self, _message, _content, _image_file=None):
         return SimpleNamespace(id=31, guild=SimpleNamespace(id=100), created_at=None)